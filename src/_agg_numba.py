@@ -0,0 +1,42 @@
+"""
+Minute-bucket kernel shared by the GMonitoringCollector loaders.
+
+numba is optional: when it is installed the kernel is compiled ahead of the first call
+(explicit signatures, cached on disk), otherwise the very same body runs as plain NumPy.
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_NS_PER_MINUTE = 60_000_000_000
+
+_SIGNATURES = [
+    "Tuple((int64[:], float64[:]))(int64[:], float64[:])",
+    "UniTuple(int64[:], 2)(int64[:], int64[:])",
+]
+
+
+def _bucket_minutes(ts_ns: np.ndarray, vals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Chronologically sort one series and floor its timestamps to the minute.
+
+    :param ts_ns: (n,) int64 epoch nanoseconds
+    :param vals: (n,) int64 or float64 values
+    :return: (minute-floored epoch seconds, values), both in timestamp order
+    """
+    # mergesort is stable and supported by both NumPy and numba
+    order = np.argsort(ts_ns, kind="mergesort")
+    return ts_ns[order] // _NS_PER_MINUTE * 60, vals[order]
+
+
+if njit is not None:
+    bucket_minutes = njit(_SIGNATURES, cache=True)(_bucket_minutes)
+else:
+    bucket_minutes = _bucket_minutes
@@ -0,0 +1,100 @@
+"""
+Vectorized kernels for the perquery latency DISTRIBUTION series.
+
+All points of one series are processed at once as NumPy arrays. The results match
+the per-point loop in GMonitoringCollector._ingest_perquery_latency, which is still
+used for series whose bucket layout changes between points.
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+def cumulative_deltas(values: np.ndarray) -> np.ndarray:
+    """
+    Deltas of a CUMULATIVE series: the first point keeps its own value, every later
+    delta is clamped at 0 (counter resets).
+    """
+    deltas = np.diff(values, prepend=values.dtype.type(0))
+    np.maximum(deltas[1:], 0, out=deltas[1:])
+    return deltas
+
+
+def percentile_from_explicit_buckets(bounds: np.ndarray, bucket_counts: np.ndarray, q: float) -> np.ndarray:
+    """
+    Row-wise approximate percentile q in [0,1] of explicit-bucket histograms.
+
+    :param bounds: (n_bounds,) finite bucket bounds
+    :param bucket_counts: (n_points, n_bounds + 1) non-negative counts
+    :return: (n_points,) percentile per row, 0.0 for empty rows
+
+    Buckets:
+      0: (-inf, b0)            -> interpolated over [0, b0)
+      i: [b_{i-1}, b_i)        -> linear interpolation inside the bucket
+      n: [b_{n-1}, +inf)       -> its lower bound
+    """
+    q = min(max(q, 0.0), 1.0)
+    n_points = bucket_counts.shape[0]
+    n_bounds = bounds.shape[0]
+    result = np.zeros(n_points, dtype=np.float64)
+    if n_points == 0 or n_bounds == 0:
+        return result
+
+    cum = np.cumsum(bucket_counts, axis=1)
+    total = cum[:, -1]
+    target = q * total
+
+    # First non-empty bucket whose cumulative count reaches the target
+    reached = (cum >= target[:, None]) & (bucket_counts > 0)
+    idx = reached.argmax(axis=1)
+    hit = (total > 0) & reached.any(axis=1)
+    # Rounding left the target above every bucket: last finite bound
+    result[(total > 0) & ~hit] = bounds[-1]
+
+    rows = np.flatnonzero(hit)
+    i = idx[rows]
+    c = bucket_counts[rows, i]
+    within = (target[rows] - (cum[rows, i] - c)) / c
+
+    first = i == 0
+    last = i >= n_bounds
+    middle = ~first & ~last
+    result[rows[first]] = np.maximum(0.0, within[first] * bounds[0])
+    result[rows[last]] = bounds[-1]
+    lower = bounds[i[middle] - 1]
+    upper = bounds[i[middle]]
+    result[rows[middle]] = lower + within[middle] * (upper - lower)
+    return result
+
+
+def latency_kernel(
+        counts: np.ndarray,
+        means_us: np.ndarray,
+        bucket_counts: np.ndarray,
+        bounds: np.ndarray,
+        q: float = 0.75,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-point (count, mean, percentile) of one chronologically sorted CUMULATIVE
+    distribution series with a fixed bucket layout.
+
+    :param counts: (n,) cumulative sample counts
+    :param means_us: (n,) cumulative means in microseconds
+    :param bucket_counts: (n, n_bounds + 1) cumulative bucket counts
+    :param bounds: (n_bounds,) explicit bucket bounds, non-empty
+    :return: (delta_count int64, mean_us float64, pr_us float64)
+    """
+    delta_count = cumulative_deltas(counts)
+    delta_sum_us = cumulative_deltas(means_us * counts)
+
+    has_samples = delta_count > 0
+    mean_us = np.zeros(counts.shape[0], dtype=np.float64)
+    np.divide(delta_sum_us, delta_count, out=mean_us, where=has_samples)
+
+    delta_buckets = bucket_counts.copy()
+    np.maximum(np.diff(bucket_counts, axis=0), 0, out=delta_buckets[1:])
+
+    pr_us = np.where(has_samples, percentile_from_explicit_buckets(bounds, delta_buckets, q), 0.0)
+    return delta_count, mean_us, pr_us
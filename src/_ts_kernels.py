@@ -0,0 +1,74 @@
+"""
+Compiled kernels behind TimeSeries (see metrics.py).
+
+numba is optional. When it is installed every kernel is compiled eagerly for one explicit
+signature and cached on disk (cache=True), so only the very first run of the CLI pays the
+compile; later processes load the machine code from the cache. Without numba,
+HAVE_NUMBA is False and TimeSeries keeps to its NumPy code paths.
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+_NS_PER_MINUTE = 60_000_000_000
+_NS_PER_HOUR = 60 * _NS_PER_MINUTE
+
+# int64 timestamps, float64 values, int64 bucket size, avg flag
+_GROUP_SORTED_MINUTES_SIGNATURE = "Tuple((int64[:], float64[:]))(int64[:], float64[:], int64, boolean)"
+
+
+def _group_sorted_minutes(
+        ts_ns: np.ndarray,
+        vals: np.ndarray,
+        step_ns: int,
+        mode_avg: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Single-pass minute bucketing of a time-sorted series (see TimeSeries.group_by_minutes).
+
+    Buckets restart at every full hour; values are summed left to right so the float
+    results match a plain running total.
+
+    :param ts_ns: (n,) int64 epoch nanoseconds, non-decreasing
+    :param vals: (n,) float64 values
+    :param step_ns: bucket size in nanoseconds
+    :param mode_avg: average instead of sum per bucket
+    :return: (bucket start nanoseconds, aggregated values)
+    """
+    n = ts_ns.shape[0]
+    out_ts = np.empty(n, dtype=np.int64)
+    out_vals = np.empty(n, dtype=np.float64)
+    k = -1
+    count = 0
+    cur_bucket = 0
+    for i in range(n):
+        hour = ts_ns[i] - ts_ns[i] % _NS_PER_HOUR
+        bucket = hour + (ts_ns[i] - hour) // step_ns * step_ns
+        if k < 0 or bucket != cur_bucket:
+            if k >= 0 and mode_avg:
+                out_vals[k] /= count
+            k += 1
+            cur_bucket = bucket
+            out_ts[k] = bucket
+            out_vals[k] = 0.0
+            count = 0
+        out_vals[k] += vals[i]
+        count += 1
+    if k >= 0 and mode_avg:
+        out_vals[k] /= count
+    return out_ts[:k + 1], out_vals[:k + 1]
+
+
+if njit is not None:
+    group_sorted_minutes = njit(_GROUP_SORTED_MINUTES_SIGNATURE, cache=True)(_group_sorted_minutes)
+else:
+    group_sorted_minutes = _group_sorted_minutes
@@ -14,12 +14,12 @@ import config as config
 from g_monitoring_collector import GMonitoringCollector
 from cloudsql_admin_collector import CloudSQLAdminCollector
 
-def analysis_entry(project_id, instance_id, output_dir, start_time, end_time, duration_hours):
+def analysis_entry(project_id, instance_id, output_dir, start_time, end_time, duration_hours, probe_headers=False):
     # start_time = datetime(2026, 1, 29, 20, 30, 0, tzinfo=timezone.utc)
     time_fmt = "%Y-%m-%d %H_%M UTC"
 
     collector = GMonitoringCollector(project_id, instance_id, start_time=start_time, end_time=end_time,
-                                   duration_hours=duration_hours)
+                                   duration_hours=duration_hours, probe_headers=probe_headers)
 
 
 
@@ -7,7 +7,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from metrics import CloudSQLMetrics
-from utils import bytes_to_unit, get_disk_iops_tp
+from utils import bytes_to_unit, bytes_to_unit_arr, get_disk_iops_tp
 
 
 
@@ -53,7 +53,7 @@ def disk_overview(metrics: CloudSQLMetrics) -> go.Figure:
         fig.add_trace(
             go.Scatter(
                 x=values.timestamps(),
-                y=[bytes_to_unit(v) for v in values.data()],
+                y=bytes_to_unit_arr(values.vals),
                 name=d_type,
                 mode="lines",
                 # line=dict(color=CONNECTION_STATE_COLORS[state]),
@@ -70,7 +70,7 @@ def disk_overview(metrics: CloudSQLMetrics) -> go.Figure:
     fig.add_trace(
         go.Scatter(
             x=x_ts,
-            y=[bytes_to_unit(v) for v in metrics.disk_quota.data()],
+            y=bytes_to_unit_arr(metrics.disk_quota.vals),
             mode="lines",
             line=dict(
                 color="lightcoral",
@@ -360,11 +360,11 @@ def disk_usage_pie_overview(
     # RIGHT: Time series (legend ON)
     # -------------------
     x_used = metrics.disk_quota.timestamps()
-    y_used = metrics.disk_quota.data()
+    y_used = metrics.disk_quota.vals
     fig.add_trace(
         go.Scatter(
             x=x_used,
-            y=[bytes_to_unit(v) for v in y_used],
+            y=bytes_to_unit_arr(y_used),
             mode="lines",
             name="quota",
             hovertemplate="%{x}<br>%{y:.2f} GiB<extra></extra>",
@@ -377,11 +377,11 @@ def disk_usage_pie_overview(
 
 
     x_used = metrics.disk_bytes_used.timestamps()
-    y_used = metrics.disk_bytes_used.data()
+    y_used = metrics.disk_bytes_used.vals
     fig.add_trace(
         go.Scatter(
             x=x_used,
-            y=[bytes_to_unit(v) for v in y_used],
+            y=bytes_to_unit_arr(y_used),
             mode="lines",
             name="disk_bytes_used",
             hovertemplate="%{x}<br>%{y:.2f} GiB<extra></extra>",
@@ -394,7 +394,7 @@ def disk_usage_pie_overview(
         fig.add_trace(
             go.Scatter(
                 x=ts.timestamps(),
-                y=[bytes_to_unit(v) for v in ts.data()],
+                y=bytes_to_unit_arr(ts.vals),
                 mode="lines",
                 name=f"Type: {type_name}",
                 hovertemplate="%{x}<br>%{y:.2f} GiB<extra></extra>",
@@ -407,7 +407,7 @@ def disk_usage_pie_overview(
     # Warning line + toggle
     # -------------------
     warn_x = metrics.disk_quota.timestamps()
-    warn_y = [bytes_to_unit(v* 0.9)  for v in metrics.disk_quota.data()]  # 90% in GiB
+    warn_y = bytes_to_unit_arr(metrics.disk_quota.vals * 0.9)  # 90% in GiB
 
     fig.add_trace(
         go.Scatter(
@@ -5,7 +5,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict
 
-from utils import bytes_to_unit
+from utils import bytes_to_unit, bytes_to_unit_arr
 import config as config
 
 import plotly.graph_objects as go
@@ -83,7 +83,7 @@ def general_database_overview(metrics: CloudSQLMetrics) -> go.Figure:
         fig.add_trace(
             go.Scatter(
                 x=values.timestamps(),
-                y=[bytes_to_unit(v) for v in values.data()],
+                y=bytes_to_unit_arr(values.vals),
                 name=d_type,
                 mode="lines",
                 # line=dict(color=CONNECTION_STATE_COLORS[state]),
@@ -100,7 +100,7 @@ def general_database_overview(metrics: CloudSQLMetrics) -> go.Figure:
     fig.add_trace(
         go.Scatter(
             x=x_ts,
-            y=[bytes_to_unit(v) for v in metrics.disk_quota.data()],
+            y=bytes_to_unit_arr(metrics.disk_quota.vals),
             mode="lines",
             line=dict(
                 color="lightcoral",
@@ -143,11 +143,12 @@ def general_database_overview(metrics: CloudSQLMetrics) -> go.Figure:
     for component_type, values in metrics.memory_components.items():
         if component_type == "Free":
             continue
-        bytes_values = [a * b / 100 for a, b in zip(values.data(), metrics.memory_quota.data())]
+        n = min(len(values), len(metrics.memory_quota))
+        bytes_values = values.vals[:n] * metrics.memory_quota.vals[:n] / 100
         fig.add_trace(
                 go.Scatter(
                     x=x_memory,
-                    y=[bytes_to_unit(v) for v in bytes_values],
+                    y=bytes_to_unit_arr(bytes_values),
                     name=component_type,
                     mode="lines",
                     # line=dict(color=CONNECTION_STATE_COLORS[state]),
@@ -164,7 +165,7 @@ def general_database_overview(metrics: CloudSQLMetrics) -> go.Figure:
     fig.add_trace(
         go.Scatter(
             x=x_memory,
-            y=[bytes_to_unit(v) for v in metrics.memory_quota.data()],
+            y=bytes_to_unit_arr(metrics.memory_quota.vals),
             mode="lines",
             line=dict(
                 color="lightcoral",
@@ -10,7 +10,7 @@ from collections import defaultdict
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from metrics import CloudSQLMetrics, PerqueryLockTimeMetric, PerqueryLatencyMetric, PerqueryIOTimeMetric
+from metrics import CloudSQLMetrics, PerqueryLockTimeMetric, PerqueryLatencyMetric, PerqueryIOTimeMetric, fuse_and_bucket
 import config as config
 from utils import write_table_txt
 
@@ -430,8 +430,7 @@ def sql_perquery_latency_metrics(metrics: CloudSQLMetrics) -> go.Figure:
 def sql_perquery_io_time_metrics(metrics: CloudSQLMetrics) -> go.Figure:
     items_with_totals: list[tuple[PerqueryIOTimeMetric, float, list[datetime]]] = []
     for item in metrics.perquery_IO_time_metrics:
-        copied_item = item.perquery_IO_time.copy()
-        copied_item.group_by_minutes(config.GROUP_BY_MINUTES)
+        copied_item = fuse_and_bucket([item.perquery_IO_time], config.GROUP_BY_MINUTES)
         total_io_wait_time = float(sum(copied_item.data()))
         items_with_totals.append((item, total_io_wait_time, copied_item.timestamps()))
 
@@ -523,19 +522,14 @@ def sql_perquery_io_time_metrics(metrics: CloudSQLMetrics) -> go.Figure:
         row=1, col=1
     )
 
-    bar_x_ts: list[datetime] = []
-    for item, _total in kept:
-        copied_item = item.perquery_IO_time.copy()
-        copied_item.group_by_minutes(config.GROUP_BY_MINUTES)
-        for ts in copied_item.timestamps():
-            if ts not in bar_x_ts:
-                bar_x_ts.append(ts)
-    bar_x_ts.sort()
+    # Every bucket used by any kept query, sorted: the buckets of all series pooled at once
+    bar_x_ts: list[datetime] = fuse_and_bucket(
+        (item.perquery_IO_time for item, _total in kept), config.GROUP_BY_MINUTES
+    ).timestamps()
 
     for item, _total in kept:
         qh = item.query_hash or "(no hash)"
-        copied_item = item.perquery_IO_time.copy()
-        copied_item.group_by_minutes(config.GROUP_BY_MINUTES)
+        copied_item = fuse_and_bucket([item.perquery_IO_time], config.GROUP_BY_MINUTES)
         ts_map = {ts: val / 1000 for ts, val in copied_item.values}
         customdata = [
             [
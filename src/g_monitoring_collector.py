@@ -1,23 +1,186 @@
+import asyncio
 import logging
+import operator
+import threading
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from typing import List, Any, Callable, Dict, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+from collections import ChainMap
+from itertools import chain
+import numpy as np
 from google.cloud import monitoring_v3
 
 from metrics import *
+from _agg_numba import bucket_minutes
+from _perquery_kernel import latency_kernel
+
+# Label extraction for the perquery insight metrics. Labels are merged over the
+# defaults first so itemgetter never raises; a missing label reads as None.
+_PERQUERY_MLABELS = operator.itemgetter("querystring", "query_hash", "user")
+_PERQUERY_RLABELS = operator.itemgetter("location", "database")
+_PERQUERY_IO_MLABELS = operator.itemgetter("querystring", "query_hash", "io_type", "user")
+# Fallbacks behind the label maps (see _LabelView) so the itemgetters never raise on a missing label
+_EMPTY_MLABELS = {"querystring": None, "query_hash": None, "io_type": None, "user": None}
+_EMPTY_RLABELS = {"location": None, "database": None}
+
+
+class _LabelView(ChainMap):
+    """
+    Read-only ChainMap over a time series label map and its fallback values, without copying.
+
+    ChainMap relies on KeyError, but indexing a protobuf map with a missing key inserts and
+    returns "", so membership is checked first.
+    """
+
+    def __getitem__(self, key):
+        for mapping in self.maps:
+            if key in mapping:
+                return mapping[key]
+        return self.__missing__(key)
+
+# Cloud Monitoring metric types loaded by GMonitoringCollector
+WAL_FLUSHED_BYTES_COUNT_METRIC = "cloudsql.googleapis.com/database/postgresql/write_ahead_log/flushed_bytes_count"
+WAL_INSERTED_BYTES_COUNT_METRIC = "cloudsql.googleapis.com/database/postgresql/write_ahead_log/inserted_bytes_count"
+PERQUERY_LATENCY_METRIC = "cloudsql.googleapis.com/database/postgresql/insights/perquery/latencies"
+PERQUERY_LOCK_TIME_METRIC = "cloudsql.googleapis.com/database/postgresql/insights/perquery/lock_time"
+PERQUERY_IO_TIME_METRIC = "cloudsql.googleapis.com/database/postgresql/insights/perquery/io_time"
+PSQL_NUM_BACKENDS_BY_STATE_METRIC = "cloudsql.googleapis.com/database/postgresql/num_backends_by_state"
+PSQL_TRANSACTION_COUNT_METRIC = "cloudsql.googleapis.com/database/postgresql/transaction_count"
+PSQL_STATEMENTS_EXECUTED_COUNT_METRIC = "cloudsql.googleapis.com/database/postgresql/statements_executed_count"
+CPU_USAGE_TIME_METRIC = "cloudsql.googleapis.com/database/cpu/usage_time"
+CPU_UTILIZATION_METRIC = "cloudsql.googleapis.com/database/cpu/utilization"
+DISK_QUOTA_METRIC = "cloudsql.googleapis.com/database/disk/quota"
+DISK_UTILIZATION_METRIC = "cloudsql.googleapis.com/database/disk/utilization"
+DISK_WRITE_BYTES_METRIC = "cloudsql.googleapis.com/database/disk/write_bytes_count"
+DISK_READ_OPS_COUNT_METRIC = "cloudsql.googleapis.com/database/disk/read_ops_count"
+DISK_WRITE_OPS_COUNT_METRIC = "cloudsql.googleapis.com/database/disk/write_ops_count"
+DISK_BYTES_USED_BY_TYPE_METRIC = "cloudsql.googleapis.com/database/disk/bytes_used_by_data_type"
+MEMORY_QUOTA_METRIC = "cloudsql.googleapis.com/database/memory/quota"
+MEMORY_COMPONENTS_METRIC = "cloudsql.googleapis.com/database/memory/components"
+
+# _build_request arguments of the perquery insight metrics (per-database resource)
+_PERQUERY_REQUEST = {"resource_type": "cloudsql_instance_database", "id_label": "resource_id"}
+
+_TimeSeriesView = monitoring_v3.ListTimeSeriesRequest.TimeSeriesView
+
+_ALIGN_RATE_PER_MINUTE = {
+    "alignment_period": {"seconds": 60},
+    "per_series_aligner": monitoring_v3.Aggregation.Aligner.ALIGN_RATE,
+}
+
+# One MetricServiceClient per process: channel setup (credentials, TLS, HTTP/2) is
+# paid once and every collector multiplexes its calls over the same channel.
+_SHARED_CLIENT: Optional[monitoring_v3.MetricServiceClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> monitoring_v3.MetricServiceClient:
+    global _SHARED_CLIENT
+    with _CLIENT_LOCK:
+        if _SHARED_CLIENT is None:
+            _SHARED_CLIENT = monitoring_v3.MetricServiceClient()
+        return _SHARED_CLIENT
+
+
+_NO_BUCKETS = np.empty(0, dtype=np.int64)
+
+
+_END_TIME = operator.attrgetter("interval.end_time")
+_START_TIME = operator.attrgetter("interval.start_time")
+
+
+def _series_point_time(points) -> Callable:
+    """
+    Accessor of the timestamp of the raw protobuf points of one series.
+
+    All points of a series set the same interval fields, so end_time vs start_time
+    (when end_time is unset) is decided once from the first point, not per point.
+    """
+    if len(points) and not points[0].interval.HasField("end_time"):
+        return _START_TIME
+    return _END_TIME
+
+
+def _times_ns(points) -> List[int]:
+    """Epoch nanoseconds of every raw protobuf point of one series."""
+    return [t.seconds * 1_000_000_000 + t.nanos for t in map(_series_point_time(points), points)]
+
+
+def _peek(series: Iterable) -> Tuple[Optional[Any], Iterator]:
+    """
+    First time series of a (possibly streaming) result, and an iterator over the whole
+    result including that first series. The first item is None when the result is empty.
+    """
+    it = iter(series)
+    first = next(it, None)
+    return first, (it if first is None else chain((first,), it))
+
+
+def _logged_stream(pager: Iterable, description: str) -> Iterator:
+    """Yield from `pager`, logging how many time series were fetched once it is exhausted."""
+    n = 0
+    for n, ts in enumerate(pager, 1):
+        yield ts
+    logging.info("Fetched %d time series for %s", n, description)
+
+
+def _point_rows(points, value_field: str) -> Iterator[Tuple[int, Union[int, float]]]:
+    """(epoch ns, value) per raw protobuf point, reading each point exactly once."""
+    point_time = _series_point_time(points)
+    for p in points:
+        t = point_time(p)
+        yield t.seconds * 1_000_000_000 + t.nanos, getattr(p.value, value_field)
+
+
+def _point_array(ts, dtype=np.float64) -> np.ndarray:
+    """
+    Structured (t: epoch ns, v: value) array of the raw protobuf points of one time series.
+
+    Reads the points in a single pass, so no datetime is built per point; the value is
+    taken from int64_value for integer dtypes and double_value otherwise.
+    """
+    points = type(ts).pb(ts).points
+    integer = np.issubdtype(dtype, np.integer)
+    return np.fromiter(
+        _point_rows(points, "int64_value" if integer else "double_value"),
+        dtype=np.dtype([("t", np.int64), ("v", dtype)]),
+        count=len(points),
+    )
+
+
+def _minute_epochs_and_values(ts, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """Chronologically sorted (minute-floored epoch seconds, value) arrays for one time series."""
+    rows = _point_array(ts, dtype)
+    return bucket_minutes(rows["t"], rows["v"])
+
+
+def _sorted_ns_and_values(ts, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Chronologically sorted (epoch ns, value) arrays for one time series, timestamps cut
+    to whole microseconds like the datetimes they replace.
+    """
+    rows = _point_array(ts, dtype)
+    rows = rows[np.argsort(rows["t"], kind="stable")]
+    return rows["t"] // 1_000 * 1_000, rows["v"]
 
 
 class GMonitoringCollector:
     def __init__(self, project_id: str, instance_id: str, duration_hours: int, start_time: Optional[datetime] = None,
-                 end_time: Optional[datetime] = None, max_workers: int = 8):
+                 end_time: Optional[datetime] = None, probe_headers: bool = False):
         self.project_id = project_id
         self.instance_id = instance_id
         self.duration_hours = duration_hours
         self.start_time = start_time
         self.end_time = end_time
-        self.max_workers = max_workers
-        self._monitoring_client = monitoring_v3.MetricServiceClient()
+        # Constant parts of every ListTimeSeries request
+        self._project_name = f"projects/{project_id}"
+        self._database_id = f"{project_id}:{instance_id}"
+        # Fixed "now" for this collector so every loader queries the same window
+        self._now = datetime.now(timezone.utc)
+        # Issue a cheap HEADERS-only probe before each FULL pull; pays off on mostly idle instances
+        self.probe_headers = probe_headers
+        self._monitoring_client = _get_client()
 
     def get_start_end_time(self) -> Tuple[datetime, datetime]:
         # Case 1: explicit start and end
@@ -32,7 +195,7 @@ class GMonitoringCollector:
 
         # Case 3: end_time + duration
         else:
-            end = self.end_time or datetime.now(timezone.utc)
+            end = self.end_time or self._now
             start = end - timedelta(hours=self.duration_hours)
             return start, end
 
@@ -44,61 +207,120 @@ class GMonitoringCollector:
             (True, "OK") if accessible
             (False, "<error message>") otherwise
         """
-        project_name = f"projects/{self.project_id}"
         try:
             pager = self._monitoring_client.list_metric_descriptors(
-                request={"name": project_name, "page_size": 1}
+                request={"name": self._project_name, "page_size": 1}
             )
             next(iter(pager), None)
             return True, "OK"
         except Exception as exc:
             return False, str(exc)
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _filter_for(metric_type: str, resource_type: str, id_label: Optional[str], db_id: str) -> str:
+        metric_filter = f'metric.type="{metric_type}" AND resource.type="{resource_type}" '
+        if id_label is not None:
+            metric_filter += f'AND resource.labels.{id_label}="{db_id}" '
+        return metric_filter
+
+    def _build_request(
+            self,
+            metric_type: str,
+            resource_type: str = "cloudsql_database",
+            id_label: Optional[str] = "database_id",
+            aggregation: Optional[Dict[str, Any]] = None,
+            view: _TimeSeriesView = _TimeSeriesView.FULL,
+    ) -> Dict[str, Any]:
+        """
+        Build a ListTimeSeries request for one metric type of this instance.
 
-    def load_wal_flushed_bytes_count(self) -> WALFlushedBytesCountMetric:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/postgresql/write_ahead_log/flushed_bytes_count"
-
+        :param id_label: Resource label holding "<project_id>:<instance_id>"; None disables the instance filter.
+        :param aggregation: Optional aggregation spec (e.g. ALIGN_RATE for WAL counters).
+        :param view: FULL returns the points, HEADERS only the series labels.
+        """
         start_time, end_time = self.get_start_end_time()
 
         request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
+            "name": self._project_name,
+            "filter": self._filter_for(metric_type, resource_type, id_label, self._database_id),
             "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-            "aggregation": {
-                "alignment_period": {"seconds": 60},
-                "per_series_aligner": monitoring_v3.Aggregation.Aligner.ALIGN_RATE,
-            },
+            "view": view,
         }
+        if aggregation is not None:
+            request["aggregation"] = aggregation
+        return request
 
+    def _log_request(self, request: Dict[str, Any], description: str) -> None:
         logging.debug(
-            "Loading WAL - Flushed Bytes Count time series (project_id=%s, instance_id=%s, metric_type=%s)",
+            "Loading %s (project_id=%s, instance_id=%s)",
+            description,
             self.project_id,
             self.instance_id,
-            metric_type,
         )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
+        logging.debug("Time interval: start=%s end=%s", request["interval"]["start_time"],
+                      request["interval"]["end_time"])
         logging.debug("Cloud Monitoring filter: %s", request["filter"])
 
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for WAL - Flushed Bytes Count", len(series_list))
+    @staticmethod
+    def _headers_probe(request: Dict[str, Any]) -> Dict[str, Any]:
+        """Same query as `request`, asking only for the first series header."""
+        return {**request, "view": _TimeSeriesView.HEADERS, "page_size": 1}
+
+    def _list_time_series(self, request: Dict[str, Any], description: str) -> Iterator:
+        """
+        Stream the time series of `request`; pages are fetched as the caller iterates.
+        The pager is single-pass, so consumers must iterate the result only once.
+        """
+        self._log_request(request, description)
+
+        if self.probe_headers:
+            pager = self._monitoring_client.list_time_series(request=self._headers_probe(request))
+            if next(iter(pager), None) is None:
+                logging.info("Fetched 0 time series for %s (headers probe)", description)
+                return iter(())
+
+        return _logged_stream(self._monitoring_client.list_time_series(request=request), description)
+
+    def _request_for(self, metric_type: str) -> Tuple[Dict[str, Any], str]:
+        """(request, description) of one metric type, as declared in _FETCH_SPECS."""
+        kwargs, description, _ = self._FETCH_SPECS[metric_type]
+        return self._build_request(metric_type, **kwargs), description
+
+    def _load(self, metric_type: str) -> Any:
+        """Fetch and ingest one metric type with the synchronous client."""
+        request, description = self._request_for(metric_type)
+        return self._ingest(metric_type, self._list_time_series(request, description))
+
+    async def _list_time_series_async(self, client: monitoring_v3.MetricServiceAsyncClient,
+                                      request: Dict[str, Any], description: str) -> list:
+        self._log_request(request, description)
+
+        if self.probe_headers:
+            pager = await client.list_time_series(request=self._headers_probe(request))
+            if await anext(aiter(pager), None) is None:
+                logging.info("Fetched 0 time series for %s (headers probe)", description)
+                return []
+
+        pager = await client.list_time_series(request=request)
+        series_list = [ts async for ts in pager]
+        logging.info("Fetched %d time series for %s", len(series_list), description)
+        return series_list
+
+    def load_wal_flushed_bytes_count(self) -> WALFlushedBytesCountMetric:
+        return self._load(WAL_FLUSHED_BYTES_COUNT_METRIC)
 
-        if not series_list:
+    def _ingest_wal_flushed_bytes_count(self, series_list) -> WALFlushedBytesCountMetric:
+        first, series_list = _peek(series_list)
+        if first is None:
             return WALFlushedBytesCountMetric(
-                database_id=f"{self.project_id}:{self.instance_id}",
+                database_id=self._database_id,
                 region=None,
                 wal_flushed_bytes_count=TimeSeries(unit="bytes"),
             )
 
         # Check resource identity (should be identical for all returned series)
-        r0 = dict(series_list[0].resource.labels)
+        r0 = dict(first.resource.labels)
         database_id = r0.get("database_id")
         region = r0.get("region")
 
@@ -109,63 +331,25 @@ class GMonitoringCollector:
         )
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                value = p.value.double_value  # RATE returns double
-
-                metric_obj.wal_flushed_bytes_count.add(dt, value)
+            ts_ns, values = _sorted_ns_and_values(ts, dtype=np.float64)  # RATE returns double
+            metric_obj.wal_flushed_bytes_count.add_many(ts_ns, values)
 
         return metric_obj
 
     def load_wal_inserted_bytes_count(self) -> WALInsertedBytesCountMetric:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/postgresql/write_ahead_log/inserted_bytes_count"
-
-        start_time, end_time = self.get_start_end_time()
-
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-            "aggregation": {
-                "alignment_period": {"seconds": 60},
-                "per_series_aligner": monitoring_v3.Aggregation.Aligner.ALIGN_RATE,
-            },
-        }
+        return self._load(WAL_INSERTED_BYTES_COUNT_METRIC)
 
-        logging.debug(
-            "Loading WAL - Inserted Bytes Count time series (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for WAL - Inserted Bytes Count", len(series_list))
-
-        if not series_list:
+    def _ingest_wal_inserted_bytes_count(self, series_list) -> WALInsertedBytesCountMetric:
+        first, series_list = _peek(series_list)
+        if first is None:
             return WALInsertedBytesCountMetric(
-                database_id=f"{self.project_id}:{self.instance_id}",
+                database_id=self._database_id,
                 region=None,
                 wal_inserted_bytes_count=TimeSeries(unit="bytes"),
             )
 
         # Check resource identity (should be identical for all returned series)
-        r0 = dict(series_list[0].resource.labels)
+        r0 = dict(first.resource.labels)
         database_id = r0.get("database_id")
         region = r0.get("region")
 
@@ -176,55 +360,21 @@ class GMonitoringCollector:
         )
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                value = p.value.double_value  # RATE returns double
-
-                metric_obj.wal_inserted_bytes_count.add(dt, value)
+            ts_ns, values = _sorted_ns_and_values(ts, dtype=np.float64)  # RATE returns double
+            metric_obj.wal_inserted_bytes_count.add_many(ts_ns, values)
 
         return metric_obj
 
     def load_perquery_latency(self) -> List[PerqueryLatencyMetric]:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/postgresql/insights/perquery/latencies"
-        start_time, end_time = self.get_start_end_time()
-
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_instance_database" '
-                f'AND resource.labels.resource_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading perquery latencies series (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for perquery latencies", len(series_list))
+        return self._load(PERQUERY_LATENCY_METRIC)
 
+    def _ingest_perquery_latency(self, series_list) -> List[PerqueryLatencyMetric]:
         # Group by identifying labels (so each unique query/user/db becomes one object)
         grouped: Dict[Tuple[str, str, str, str, str], PerqueryLatencyMetric] = {}
 
         def _percentile_from_explicit_buckets(
                 bounds: List[float],
-                bucket_counts: List[int],
+                bucket_counts: np.ndarray,
                 q: float,
         ) -> float:
             """
@@ -239,7 +389,7 @@ class GMonitoringCollector:
             We linearly interpolate inside the bucket assuming uniform density.
             For the +inf bucket we return its lower bound.
             """
-            total = sum(bucket_counts)
+            total = int(bucket_counts.sum())
             if total <= 0:
                 return 0.0
 
@@ -252,7 +402,7 @@ class GMonitoringCollector:
             target = q * total
             cum = 0.0
 
-            for i, c in enumerate(bucket_counts):
+            for i, c in enumerate(bucket_counts.tolist()):
                 if c <= 0:
                     cum += c
                     continue
@@ -283,15 +433,10 @@ class GMonitoringCollector:
             return float(bounds[-1]) if bounds else 0.0
 
         for ts in series_list:
-            mlabels = dict(ts.metric.labels)
-            rlabels = dict(ts.resource.labels)
-
-            querystring = mlabels.get("querystring")
-            query_hash = mlabels.get("query_hash")
-            user = mlabels.get("user")
-            location = rlabels.get("location")
-            database = rlabels.get("database")
+            querystring, query_hash, user = _PERQUERY_MLABELS(_LabelView(ts.metric.labels, _EMPTY_MLABELS))
+            location, database = _PERQUERY_RLABELS(_LabelView(ts.resource.labels, _EMPTY_RLABELS))
 
+            # A missing and an empty label group together; the metric object keeps the raw value
             key = (
                 query_hash or "",
                 querystring or "",
@@ -316,20 +461,58 @@ class GMonitoringCollector:
                 grouped[key] = metric_obj
 
             # Points are DISTRIBUTION and (typically) CUMULATIVE => compute deltas between points.
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
+            # Raw protobuf points: timestamps stay integers until the minute is known.
+            pb_points = type(ts).pb(ts).points
+            times_ns = _times_ns(pb_points)
+            order = sorted(range(len(times_ns)), key=times_ns.__getitem__)
+            points = [pb_points[i] for i in order]
+            minute_epochs = [times_ns[i] // 60_000_000_000 * 60 for i in order]
 
             last_count: Optional[int] = None
             last_sum_us: Optional[float] = None  # sum of samples in microseconds (mean * count)
-            last_bucket_counts: Optional[List[int]] = None
+            last_bucket_counts: Optional[np.ndarray] = None
             last_bounds: Optional[List[float]] = None
 
+            # The bucket layout is normally fixed per distribution schema: read it once per series
+            # and reuse it for every point whose bounds are equal to it.
+            series_bounds: List[float] = []
+            if points:
+                try:
+                    series_bounds = list(points[0].value.distribution_value.bucket_options.explicit_buckets.bounds)
+                except Exception:
+                    series_bounds = []
+
+            # Fast path: fixed bucket layout across the series -> whole series in one NumPy pass
+            n_buckets = len(series_bounds) + 1
+            if series_bounds and all(
+                    list(p.value.distribution_value.bucket_options.explicit_buckets.bounds) == series_bounds
+                    and len(p.value.distribution_value.bucket_counts) == n_buckets
+                    for p in points
+            ):
+                n = len(points)
+                epochs = np.array(minute_epochs, dtype=np.int64)
+                counts = np.fromiter((p.value.distribution_value.count for p in points), dtype=np.int64, count=n)
+                means_us = np.fromiter((p.value.distribution_value.mean for p in points), dtype=np.float64, count=n)
+                bucket_counts = np.fromiter(
+                    chain.from_iterable(p.value.distribution_value.bucket_counts for p in points),
+                    dtype=np.int64,
+                    count=n * n_buckets,
+                ).reshape(n, n_buckets)
+
+                delta_count, mean_us, pr75_us = latency_kernel(
+                    counts, means_us, bucket_counts, np.asarray(series_bounds, dtype=np.float64), 0.75
+                )
+                metric_obj.perquery_count.add_bulk(epochs, delta_count)
+                metric_obj.perquery_latency_mean.add_bulk(epochs, mean_us)
+                metric_obj.perquery_latency_pr75.add_bulk(epochs, pr75_us)
+                continue
+
+            # Fallback: bucket layout changes (or is missing) between points.
+            # Results are collected per series and appended in one call per TimeSeries.
+            count_values: List[int] = []
+            mean_values: List[float] = []
+            pr75_values: List[float] = []
             for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-
                 dist = p.value.distribution_value
 
                 cur_count = int(dist.count)
@@ -338,22 +521,23 @@ class GMonitoringCollector:
 
                 # Explicit bucket configuration (needed for pr75)
                 bounds: List[float] = []
-                buckets: List[int] = []
+                buckets: np.ndarray = _NO_BUCKETS
                 try:
-                    eb = dist.bucket_options.explicit_buckets
-                    bounds = list(eb.bounds)
-                    buckets = [int(x) for x in dist.bucket_counts]
+                    eb_bounds = list(dist.bucket_options.explicit_buckets.bounds)
+                    bounds = series_bounds if eb_bounds == series_bounds else eb_bounds
+                    buckets = np.asarray(dist.bucket_counts, dtype=np.int64)
                 except Exception:
                     # If buckets are unavailable, we can still compute count & mean.
                     bounds = []
-                    buckets = []
+                    buckets = _NO_BUCKETS
 
                 # First point: cannot delta against previous; treat as "delta == current" (same as your lock_time logic)
+                # (bounds are never mutated, so they are shared rather than copied)
                 if last_count is None:
                     delta_count = cur_count
                     delta_sum_us = cur_sum_us
-                    delta_buckets = buckets[:] if buckets else []
-                    delta_bounds = bounds[:] if bounds else []
+                    delta_buckets = buckets
+                    delta_bounds = bounds
                 else:
                     delta_count = cur_count - last_count
                     if delta_count < 0:
@@ -365,53 +549,56 @@ class GMonitoringCollector:
 
                     # Bucket-wise delta (only if layout matches)
                     if (
-                            buckets
-                            and last_bucket_counts
+                            buckets.size
+                            and last_bucket_counts is not None
+                            and last_bucket_counts.size
                             and bounds
                             and last_bounds
                             and len(bounds) == len(last_bounds)
-                            and len(buckets) == len(last_bucket_counts)
+                            and buckets.size == last_bucket_counts.size
                     ):
-                        delta_buckets = []
-                        for cur_b, last_b in zip(buckets, last_bucket_counts):
-                            d = cur_b - last_b
-                            delta_buckets.append(d if d > 0 else 0)
+                        delta_buckets = np.maximum(buckets - last_bucket_counts, 0)
                         delta_bounds = bounds
                     else:
-                        delta_buckets = []
-                        delta_bounds = bounds[:] if bounds else []
+                        delta_buckets = _NO_BUCKETS
+                        delta_bounds = bounds
 
                 # perquery_count
-                metric_obj.perquery_count.add(dt, int(delta_count))
+                count_values.append(int(delta_count))
 
                 # perquery_latency_mean (microseconds)
                 if delta_count > 0:
                     mean_us = float(delta_sum_us) / float(delta_count)
                 else:
                     mean_us = 0.0
-                metric_obj.perquery_latency_mean.add(dt, mean_us)
+                mean_values.append(mean_us)
 
                 # perquery_latency_pr75 (microseconds) from delta histogram
-                if delta_count > 0 and delta_buckets and delta_bounds:
+                if delta_count > 0 and delta_buckets.size and delta_bounds:
                     pr75_us = _percentile_from_explicit_buckets(delta_bounds, delta_buckets, 0.75)
                 else:
                     # Fallback if we can't compute from buckets:
                     # with delta_count==1, mean is the best estimate; otherwise 0
                     pr75_us = mean_us if delta_count == 1 else 0.0
-                metric_obj.perquery_latency_pr75.add(dt, pr75_us)
+                pr75_values.append(pr75_us)
 
                 # advance "last" for delta computation
                 last_count = cur_count
                 last_sum_us = cur_sum_us
-                last_bucket_counts = buckets[:] if buckets else []
-                last_bounds = bounds[:] if bounds else []
+                last_bucket_counts = buckets
+                last_bounds = bounds
+
+            epochs = np.array(minute_epochs, dtype=np.int64)
+            metric_obj.perquery_count.add_bulk(epochs, np.array(count_values, dtype=np.int64))
+            metric_obj.perquery_latency_mean.add_bulk(epochs, np.array(mean_values, dtype=np.float64))
+            metric_obj.perquery_latency_pr75.add_bulk(epochs, np.array(pr75_values, dtype=np.float64))
 
         # Sort each metric chronologically
         result = list(grouped.values())
         for obj in result:
-            obj.perquery_count.values.sort(key=lambda tv: tv[0])
-            obj.perquery_latency_mean.values.sort(key=lambda tv: tv[0])
-            obj.perquery_latency_pr75.values.sort(key=lambda tv: tv[0])
+            obj.perquery_count.sort()
+            obj.perquery_latency_mean.sort()
+            obj.perquery_latency_pr75.sort()
 
         logging.info(
             "Returning %d perquery latency metrics (unique query/user/location/db buckets)",
@@ -421,49 +608,17 @@ class GMonitoringCollector:
         return result
 
     def load_perquery_lock_time(self) -> list[PerqueryLockTimeMetric]:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/postgresql/insights/perquery/lock_time"
-
-        start_time, end_time = self.get_start_end_time()
-
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_instance_database" '
-                f'AND resource.labels.resource_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading perquery lock time series (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for perquery lock time", len(series_list))
+        return self._load(PERQUERY_LOCK_TIME_METRIC)
 
+    def _ingest_perquery_lock_time(self, series_list) -> list[PerqueryLockTimeMetric]:
         # Group by identifying labels (so each unique query/user/db becomes one object)
         grouped: Dict[Tuple[str, str, str, str, str], PerqueryLockTimeMetric] = {}
 
         for ts in series_list:
-            mlabels = dict(ts.metric.labels)
-            rlabels = dict(ts.resource.labels)
-
-            querystring = mlabels.get("querystring")
-            query_hash = mlabels.get("query_hash")
-            user = mlabels.get("user")
-            location = rlabels.get("location")
-            database = rlabels.get("database")
+            querystring, query_hash, user = _PERQUERY_MLABELS(_LabelView(ts.metric.labels, _EMPTY_MLABELS))
+            location, database = _PERQUERY_RLABELS(_LabelView(ts.resource.labels, _EMPTY_RLABELS))
 
+            # A missing and an empty label group together; the metric object keeps the raw value
             key = (
                 query_hash or "",
                 querystring or "",
@@ -486,29 +641,16 @@ class GMonitoringCollector:
                 )
                 grouped[key] = metric_obj
 
-            last_p = None
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                cur = int(p.value.int64_value)
-                if last_p is None:
-                    delta = cur
-                else:
-                    delta = cur - last_p
-                    if delta < 0:
-                        delta = 0
-                metric_obj.perquery_lock_time.add(dt, delta)
-                last_p = cur
+            # Points are CUMULATIVE => delta against the previous point (first point: delta == current).
+            epochs, values = _minute_epochs_and_values(ts, dtype=np.int64)
+            deltas = np.diff(values, prepend=0)
+            np.maximum(deltas[1:], 0, out=deltas[1:])
+            metric_obj.perquery_lock_time.add_bulk(epochs, deltas)
 
         # Sort each metric chronologically (Cloud Monitoring often returns newest-first)
         result = list(grouped.values())
         for obj in result:
-            obj.perquery_lock_time.values.sort(key=lambda tv: tv[0])
+            obj.perquery_lock_time.sort()
 
         logging.info(
             "Returning %d perquery lock time metrics (unique query/user/location/db buckets)",
@@ -518,48 +660,17 @@ class GMonitoringCollector:
         return result
 
     def load_perquery_IO_time(self) -> list[PerqueryIOTimeMetric]:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/postgresql/insights/perquery/io_time"
-
-        start_time, end_time = self.get_start_end_time()
-
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_instance_database" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading perquery IO time series (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for perquery IO time", len(series_list))
+        return self._load(PERQUERY_IO_TIME_METRIC)
 
+    def _ingest_perquery_IO_time(self, series_list) -> list[PerqueryIOTimeMetric]:
         # Group by identifying labels (so each unique query_hash/io_type/db/user becomes one object)
         grouped: Dict[Tuple[str, str, str, str], PerqueryIOTimeMetric] = {}
 
         for ts in series_list:
-            mlabels = dict(ts.metric.labels)
-            rlabels = dict(ts.resource.labels)
-
-            querystring = mlabels.get("querystring")
-            query_hash = mlabels.get("query_hash")
-            io_type = mlabels.get("io_type")
-            user = mlabels.get("user")
-            database = rlabels.get("database")
+            querystring, query_hash, io_type, user = _PERQUERY_IO_MLABELS(_LabelView(ts.metric.labels, _EMPTY_MLABELS))
+            database = ts.resource.labels.get("database")
 
+            # A missing and an empty label group together; the metric object keeps the raw value
             key = (
                 query_hash or "",
                 io_type or "",
@@ -581,21 +692,12 @@ class GMonitoringCollector:
                 )
                 grouped[key] = metric_obj
 
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                metric_obj.perquery_IO_time.add(dt, p.value.int64_value)
-
+            metric_obj.perquery_IO_time.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         # Sort each metric chronologically (Cloud Monitoring often returns newest-first)
         result = list(grouped.values())
         for obj in result:
-            obj.perquery_IO_time.values.sort(key=lambda tv: tv[0])
+            obj.perquery_IO_time.sort()
 
         logging.info(
             "Returning %d perquery IO time metrics (unique query_hash/io_type/db/user buckets)",
@@ -605,37 +707,11 @@ class GMonitoringCollector:
         return result
 
     def load_psql_num_backends_by_state(self) -> list[PSQLNumBackendsByStateMetric]:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/postgresql/num_backends_by_state"
-
-        start_time, end_time = self.get_start_end_time()
-
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading Network - PostgreSQL num of backends by state (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
+        return self._load(PSQL_NUM_BACKENDS_BY_STATE_METRIC)
 
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Network - PostgreSQL num of backends by state", len(series_list))
-
-        if not series_list:
+    def _ingest_psql_num_backends_by_state(self, series_list) -> list[PSQLNumBackendsByStateMetric]:
+        first, series_list = _peek(series_list)
+        if first is None:
             return [PSQLNumBackendsByStateMetric(
                 state="No Data",
                 database="No Data",
@@ -673,15 +749,7 @@ class GMonitoringCollector:
                 )
                 grouped[key] = metric_obj
 
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                metric_obj.psql_num_backends_by_state.add(dt, p.value.int64_value)
+            metric_obj.psql_num_backends_by_state.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         result = list(grouped.values())
 
@@ -693,37 +761,11 @@ class GMonitoringCollector:
         return result
 
     def load_psql_transaction_count(self) -> list[PSQLTransactionCountMetric]:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/postgresql/transaction_count"
+        return self._load(PSQL_TRANSACTION_COUNT_METRIC)
 
-        start_time, end_time = self.get_start_end_time()
-
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading PostgreSQL transaction count (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for PostgreSQL transaction count", len(series_list))
-
-        if not series_list:
+    def _ingest_psql_transaction_count(self, series_list) -> list[PSQLTransactionCountMetric]:
+        first, series_list = _peek(series_list)
+        if first is None:
             return [PSQLTransactionCountMetric(
                 transaction_type="No Data",
                 database="No Data",
@@ -756,15 +798,7 @@ class GMonitoringCollector:
                 )
                 grouped[key] = metric_obj
 
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                metric_obj.psql_transaction_count.add(dt, p.value.int64_value)
+            metric_obj.psql_transaction_count.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         result = list(grouped.values())
 
@@ -776,37 +810,11 @@ class GMonitoringCollector:
         return result
 
     def load_psql_statements_executed_count(self) -> list[PSQLStatementsExecutedCountMetric]:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/postgresql/statements_executed_count"
-
-        start_time, end_time = self.get_start_end_time()
-
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading PostgreSQL Statements Executed Count (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
+        return self._load(PSQL_STATEMENTS_EXECUTED_COUNT_METRIC)
 
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for PostgreSQL Statements Executed Count", len(series_list))
-
-        if not series_list:
+    def _ingest_psql_statements_executed_count(self, series_list) -> list[PSQLStatementsExecutedCountMetric]:
+        first, series_list = _peek(series_list)
+        if first is None:
             return [PSQLStatementsExecutedCountMetric(
                 operation_type="No Data",
                 database="No Data",
@@ -839,15 +847,7 @@ class GMonitoringCollector:
                 )
                 grouped[key] = metric_obj
 
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                metric_obj.psql_statements_executed_count.add(dt, p.value.int64_value)
+            metric_obj.psql_statements_executed_count.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         result = list(grouped.values())
 
@@ -859,425 +859,164 @@ class GMonitoringCollector:
         return result
 
     def load_cpu_usage_time(self) -> TimeSeries:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/cpu/usage_time"
-
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-
-        logging.debug(
-            "Loading CPU - Usage time (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for CPU - Usage time", len(series_list))
+        return self._load(CPU_USAGE_TIME_METRIC)
 
-        if not series_list:
+    def _ingest_cpu_usage_time(self, series_list) -> TimeSeries:
+        first, series_list = _peek(series_list)
+        if first is None:
             return TimeSeries(unit="CPU-seconds")
 
         results: TimeSeries = TimeSeries(unit="CPU-seconds")
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                results.add(dt, p.value.double_value)
+            results.add_bulk(*_minute_epochs_and_values(ts, dtype=np.float64))
 
         logging.info(
             "Returning %d CPU - Usage time",
-            len(results.values),
+            len(results),
         )
 
         return results
 
     def load_cpu_utilization(self) -> TimeSeries:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/cpu/utilization"
+        return self._load(CPU_UTILIZATION_METRIC)
 
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
+    def _ingest_cpu_utilization(self, series_list) -> TimeSeries:
+        first, series_list = _peek(series_list)
+        if first is None:
+            return TimeSeries(unit="%", dtype=np.float32)
 
-        logging.debug(
-            "Loading CPU - Utilization (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for CPU - Utilization", len(series_list))
-
-        if not series_list:
-            return TimeSeries(unit="%")
-
-        results: TimeSeries = TimeSeries(unit="%")
+        # Utilization is a 0..1 ratio: float32 keeps ~7 significant digits at half the memory
+        results: TimeSeries = TimeSeries(unit="%", dtype=np.float32)
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                results.add(dt, p.value.double_value)
+            results.add_bulk(*_minute_epochs_and_values(ts, dtype=np.float64))
 
         logging.info(
             "Returning %d CPU - Utilization",
-            len(results.values),
+            len(results),
         )
 
         return results
 
     def load_disk_quota(self) -> TimeSeries:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/disk/quota"
-
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading Disk - Quota (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Disk - Quota", len(series_list))
+        return self._load(DISK_QUOTA_METRIC)
 
-        if not series_list:
+    def _ingest_disk_quota(self, series_list) -> TimeSeries:
+        first, series_list = _peek(series_list)
+        if first is None:
             return TimeSeries(unit="bytes")
 
         results: TimeSeries = TimeSeries(unit="bytes")
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                results.add(dt, p.value.int64_value)
+            results.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         logging.info(
             "Returning %d Disk - Quota",
-            len(results.values),
+            len(results),
         )
 
         return results
 
     def load_disk_utilization(self) -> TimeSeries:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/disk/utilization"
-
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
+        return self._load(DISK_UTILIZATION_METRIC)
 
-        logging.debug(
-            "Loading Disk - Quota (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
+    def _ingest_disk_utilization(self, series_list) -> TimeSeries:
+        first, series_list = _peek(series_list)
+        if first is None:
+            return TimeSeries(unit="%", dtype=np.float32)
 
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Disk - utilization", len(series_list))
-
-        if not series_list:
-            return TimeSeries(unit="%")
-
-        results: TimeSeries = TimeSeries(unit="%")
+        # DOUBLE gauge holding a 0..1 ratio, stored as float32 like CPU utilization
+        results: TimeSeries = TimeSeries(unit="%", dtype=np.float32)
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                results.add(dt, p.value.int64_value)
+            results.add_bulk(*_minute_epochs_and_values(ts, dtype=np.float64))
 
         logging.info(
             "Returning %d Disk - utilization",
-            len(results.values),
+            len(results),
         )
 
         return results
 
     def load_disk_write_bytes(self) -> TimeSeries:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/disk/write_bytes_count"
+        return self._load(DISK_WRITE_BYTES_METRIC)
 
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading Disk - Write Bytes (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Disk - Write Bytes", len(series_list))
-
-        if not series_list:
+    def _ingest_disk_write_bytes(self, series_list) -> TimeSeries:
+        first, series_list = _peek(series_list)
+        if first is None:
             return TimeSeries(unit="%")
 
         results: TimeSeries = TimeSeries(unit="%")
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                results.add(dt, p.value.int64_value)
+            results.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         logging.info(
             "Returning %d Disk - Write Bytes",
-            len(results.values),
+            len(results),
         )
 
         return results
 
     def load_disk_read_ops_count(self) -> TimeSeries:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/disk/read_ops_count"
-
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
+        return self._load(DISK_READ_OPS_COUNT_METRIC)
 
-        logging.debug(
-            "Loading Disk - Read Ops Count (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Disk - Read Ops Count", len(series_list))
-
-        if not series_list:
+    def _ingest_disk_read_ops_count(self, series_list) -> TimeSeries:
+        first, series_list = _peek(series_list)
+        if first is None:
             return TimeSeries(unit="count")
 
         results: TimeSeries = TimeSeries(unit="count")
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                results.add(dt, p.value.int64_value)
+            results.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         logging.info(
             "Returning %d Disk - Read Ops Count",
-            len(results.values),
+            len(results),
         )
 
         return results
 
     def load_disk_write_ops_count(self) -> TimeSeries:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/disk/write_ops_count"
+        return self._load(DISK_WRITE_OPS_COUNT_METRIC)
 
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading Disk - Write Ops Count (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Disk - Write Ops Count", len(series_list))
-
-        if not series_list:
+    def _ingest_disk_write_ops_count(self, series_list) -> TimeSeries:
+        first, series_list = _peek(series_list)
+        if first is None:
             return TimeSeries(unit="count")
 
         results: TimeSeries = TimeSeries(unit="count")
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                results.add(dt, p.value.int64_value)
+            results.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         logging.info(
             "Returning %d Disk - Write Ops Count",
-            len(results.values),
+            len(results),
         )
 
         return results
 
     def load_disk_bytes_used_by_type(self) -> Dict[str, TimeSeries]:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/disk/bytes_used_by_data_type"
-
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading Disk - bytes used by type (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Disk - bytes used by type", len(series_list))
+        return self._load(DISK_BYTES_USED_BY_TYPE_METRIC)
 
-        if not series_list:
+    def _ingest_disk_bytes_used_by_type(self, series_list) -> Dict[str, TimeSeries]:
+        first, series_list = _peek(series_list)
+        if first is None:
             return {"Not Available" : TimeSeries(unit="bytes")}
 
         results: Dict[str, TimeSeries] = {}
 
         for ts in series_list:
-            mlabels = dict(ts.metric.labels)
-            data_type = mlabels["data_type"]
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-            datas = results.get(data_type, TimeSeries(unit="bytes"))
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                datas.add(dt, p.value.int64_value)
-                results[data_type] = datas
+            data_type = ts.metric.labels["data_type"]
+            epochs, values = _minute_epochs_and_values(ts, dtype=np.int64)
+            if not epochs.shape[0]:
+                # a type only gets an entry once it has points
+                continue
+            results.setdefault(data_type, TimeSeries(unit="bytes")).add_bulk(epochs, values)
 
         logging.info(
             "Returning %d types of Disk - bytes used by type",
@@ -1287,106 +1026,42 @@ class GMonitoringCollector:
         return results
 
     def load_memory_quota(self) -> TimeSeries:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/memory/quota"
+        return self._load(MEMORY_QUOTA_METRIC)
 
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading Memory - Quota (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
-
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Memory - Quota", len(series_list))
-
-        if not series_list:
+    def _ingest_memory_quota(self, series_list) -> TimeSeries:
+        first, series_list = _peek(series_list)
+        if first is None:
             return TimeSeries(unit="bytes")
 
         results: TimeSeries = TimeSeries(unit="bytes")
 
         for ts in series_list:
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                results.add(dt, p.value.int64_value)
+            results.add_bulk(*_minute_epochs_and_values(ts, dtype=np.int64))
 
         logging.info(
             "Returning %d Memory - Quota",
-            len(results.values),
+            len(results),
         )
 
         return results
 
     def load_memory_components(self) -> Dict[str, TimeSeries]:
-        client = self._monitoring_client
-        project_name = f"projects/{self.project_id}"
-        metric_type = "cloudsql.googleapis.com/database/memory/components"
-
-        start_time, end_time = self.get_start_end_time()
-        request = {
-            "name": project_name,
-            "filter": (
-                f'metric.type="{metric_type}" '
-                f'AND resource.type="cloudsql_database" '
-                f'AND resource.labels.database_id="{self.project_id}:{self.instance_id}" '
-            ),
-            "interval": {"start_time": start_time, "end_time": end_time},
-            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-        }
-
-        logging.debug(
-            "Loading Memory - components (project_id=%s, instance_id=%s, metric_type=%s)",
-            self.project_id,
-            self.instance_id,
-            metric_type,
-        )
-        logging.debug("Time interval: start=%s end=%s", start_time, end_time)
-        logging.debug("Cloud Monitoring filter: %s", request["filter"])
+        return self._load(MEMORY_COMPONENTS_METRIC)
 
-        # IMPORTANT: materialize the pager once; otherwise a second loop sees nothing.
-        series_list = list(client.list_time_series(request=request))
-        logging.info("Fetched %d time series for Memory - components", len(series_list))
-
-        if not series_list:
+    def _ingest_memory_components(self, series_list) -> Dict[str, TimeSeries]:
+        first, series_list = _peek(series_list)
+        if first is None:
             return {"Not Available" : TimeSeries(unit="bytes")}
 
         results: Dict[str, TimeSeries] = {}
 
         for ts in series_list:
-            mlabels = dict(ts.metric.labels)
-            data_type = mlabels["component"]
-            points = sorted(
-                ts.points,
-                key=lambda p: (p.interval.end_time or p.interval.start_time)
-            )
-            datas = results.get(data_type, TimeSeries(unit="bytes"))
-            for p in points:
-                dt = p.interval.end_time or p.interval.start_time
-                dt = dt.replace(second=0, microsecond=0)
-                datas.add(dt, p.value.double_value)
-                results[data_type] = datas
+            data_type = ts.metric.labels["component"]
+            epochs, values = _minute_epochs_and_values(ts, dtype=np.float64)
+            if not epochs.shape[0]:
+                # a type only gets an entry once it has points
+                continue
+            results.setdefault(data_type, TimeSeries(unit="bytes")).add_bulk(epochs, values)
 
         logging.info(
             "Returning %d types of Memory - components",
@@ -1395,36 +1070,105 @@ class GMonitoringCollector:
 
         return results
 
+    # Metric type -> (_build_request arguments, log description, ingest method).
+    # ListTimeSeries accepts exactly one metric type per filter, so each entry is one request.
+    _FETCH_SPECS: Dict[str, Tuple[Dict[str, Any], str, str]] = {
+        PERQUERY_LOCK_TIME_METRIC: (_PERQUERY_REQUEST, "perquery lock time", "_ingest_perquery_lock_time"),
+        PERQUERY_LATENCY_METRIC: (_PERQUERY_REQUEST, "perquery latencies", "_ingest_perquery_latency"),
+        PERQUERY_IO_TIME_METRIC: (
+            {"resource_type": "cloudsql_instance_database", "id_label": None},
+            "perquery IO time",
+            "_ingest_perquery_IO_time",
+        ),
+        WAL_FLUSHED_BYTES_COUNT_METRIC: (
+            {"aggregation": _ALIGN_RATE_PER_MINUTE},
+            "WAL - Flushed Bytes Count",
+            "_ingest_wal_flushed_bytes_count",
+        ),
+        WAL_INSERTED_BYTES_COUNT_METRIC: (
+            {"aggregation": _ALIGN_RATE_PER_MINUTE},
+            "WAL - Inserted Bytes Count",
+            "_ingest_wal_inserted_bytes_count",
+        ),
+        PSQL_NUM_BACKENDS_BY_STATE_METRIC: (
+            {}, "Network - PostgreSQL num of backends by state", "_ingest_psql_num_backends_by_state"
+        ),
+        PSQL_TRANSACTION_COUNT_METRIC: ({}, "PostgreSQL transaction count", "_ingest_psql_transaction_count"),
+        PSQL_STATEMENTS_EXECUTED_COUNT_METRIC: (
+            {}, "PostgreSQL Statements Executed Count", "_ingest_psql_statements_executed_count"
+        ),
+        CPU_USAGE_TIME_METRIC: ({}, "CPU - Usage time", "_ingest_cpu_usage_time"),
+        CPU_UTILIZATION_METRIC: ({}, "CPU - Utilization", "_ingest_cpu_utilization"),
+        DISK_QUOTA_METRIC: ({}, "Disk - Quota", "_ingest_disk_quota"),
+        DISK_UTILIZATION_METRIC: ({}, "Disk - utilization", "_ingest_disk_utilization"),
+        DISK_WRITE_BYTES_METRIC: ({}, "Disk - Write Bytes", "_ingest_disk_write_bytes"),
+        DISK_BYTES_USED_BY_TYPE_METRIC: ({}, "Disk - bytes used by type", "_ingest_disk_bytes_used_by_type"),
+        MEMORY_QUOTA_METRIC: ({}, "Memory - Quota", "_ingest_memory_quota"),
+        MEMORY_COMPONENTS_METRIC: ({}, "Memory - components", "_ingest_memory_components"),
+        DISK_READ_OPS_COUNT_METRIC: ({}, "Disk - Read Ops Count", "_ingest_disk_read_ops_count"),
+        DISK_WRITE_OPS_COUNT_METRIC: ({}, "Disk - Write Ops Count", "_ingest_disk_write_ops_count"),
+    }
+
+    # CloudSQLMetrics attribute -> metric type it is built from
+    _METRIC_FOR_ATTR = {
+        "perquery_lock_time_metrics": PERQUERY_LOCK_TIME_METRIC,
+        "perquery_latency_metrics": PERQUERY_LATENCY_METRIC,
+        "perquery_IO_time_metrics": PERQUERY_IO_TIME_METRIC,
+        "wal_flushed_bytes_metrics": WAL_FLUSHED_BYTES_COUNT_METRIC,
+        "wal_inserted_bytes_metrics": WAL_INSERTED_BYTES_COUNT_METRIC,
+        "psql_num_backends_by_state_metrics": PSQL_NUM_BACKENDS_BY_STATE_METRIC,
+        "psql_transaction_count": PSQL_TRANSACTION_COUNT_METRIC,
+        "psql_statements_executed_count_metrics": PSQL_STATEMENTS_EXECUTED_COUNT_METRIC,
+        "cpu_usage_time": CPU_USAGE_TIME_METRIC,
+        "cpu_utilization": CPU_UTILIZATION_METRIC,
+        "disk_quota": DISK_QUOTA_METRIC,
+        "disk_utilization": DISK_UTILIZATION_METRIC,
+        "disk_read_bytes": DISK_WRITE_BYTES_METRIC,
+        "disk_bytes_used_by_type": DISK_BYTES_USED_BY_TYPE_METRIC,
+        "memory_quota": MEMORY_QUOTA_METRIC,
+        "memory_components": MEMORY_COMPONENTS_METRIC,
+        "disk_read_ops": DISK_READ_OPS_COUNT_METRIC,
+        "disk_write_ops": DISK_WRITE_OPS_COUNT_METRIC,
+    }
+
+    def _fetch_requests(self) -> Dict[str, Tuple[Dict[str, Any], str]]:
+        """(request, description) for every metric type CloudSQLMetrics needs, each type once."""
+        return {
+            metric_type: self._request_for(metric_type)
+            for metric_type in dict.fromkeys(self._METRIC_FOR_ATTR.values())
+        }
 
+    def _ingest(self, metric_type: str, series_list: list) -> Any:
+        return getattr(self, self._FETCH_SPECS[metric_type][2])(series_list)
 
-    def generate_cloudsql_metrics(self) -> CloudSQLMetrics:
-        fetch_map = {
-            "perquery_lock_time_metrics": self.load_perquery_lock_time,
-            "perquery_latency_metrics": self.load_perquery_latency,
-            "perquery_IO_time_metrics": self.load_perquery_IO_time,
-            "wal_flushed_bytes_metrics": self.load_wal_flushed_bytes_count,
-            "wal_inserted_bytes_metrics": self.load_wal_inserted_bytes_count,
-            "psql_num_backends_by_state_metrics": self.load_psql_num_backends_by_state,
-            "psql_transaction_count": self.load_psql_transaction_count,
-            "psql_statements_executed_count_metrics": self.load_psql_statements_executed_count,
-            "cpu_usage_time": self.load_cpu_usage_time,
-            "cpu_utilization": self.load_cpu_utilization,
-            "disk_quota": self.load_disk_quota,
-            "disk_utilization": self.load_disk_utilization,
-            "disk_read_bytes": self.load_disk_write_bytes,
-            "disk_bytes_used_by_type": self.load_disk_bytes_used_by_type,
-            "memory_quota": self.load_memory_quota,
-            "memory_components": self.load_memory_components,
-            "disk_read_ops": self.load_disk_read_ops_count,
-            "disk_write_ops": self.load_disk_write_ops_count
+    def _assemble(self, ingested: Dict[str, Any]) -> CloudSQLMetrics:
+        return CloudSQLMetrics(**{attr: ingested[mt] for attr, mt in self._METRIC_FOR_ATTR.items()})
 
-        }
+    async def collect_all_async(self) -> CloudSQLMetrics:
+        """
+        Fetch every metric type concurrently on the current event loop.
+        The async client is bound to this loop, so it is created here and closed on exit.
+        """
+        fetches = self._fetch_requests()
+        async with monitoring_v3.MetricServiceAsyncClient() as client:
+            results = await asyncio.gather(
+                *(self._fetch_and_ingest_async(client, metric_type, request, description)
+                  for metric_type, (request, description) in fetches.items())
+            )
+        return self._assemble(dict(zip(fetches, results)))
 
-        data = {}
-        with ThreadPoolExecutor(max_workers=10) as ex:
-            future_to_attr = {ex.submit(fn): attr for attr, fn in fetch_map.items()}
-            for fut in as_completed(future_to_attr):
-                attr = future_to_attr[fut]
-                data[attr] = fut.result()
+    async def _fetch_and_ingest_async(self, client: monitoring_v3.MetricServiceAsyncClient, metric_type: str,
+                                      request: Dict[str, Any], description: str) -> Any:
+        """
+        One metric type: ingest as soon as its own pages are in, so the CPU-bound ingest
+        overlaps with the requests still in flight for the other metric types.
+        """
+        series_list = await self._list_time_series_async(client, request, description)
+        return self._ingest(metric_type, series_list)
 
-        return CloudSQLMetrics(**data)
+    def generate_cloudsql_metrics(self) -> CloudSQLMetrics:
+        """
+        Synchronous entry point: one async client, every metric type fetched concurrently.
+        Must not be called from inside a running event loop (use collect_all_async there).
+        """
+        return asyncio.run(self.collect_all_async())
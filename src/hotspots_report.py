@@ -8,7 +8,7 @@ from urllib.parse import quote
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Optional
 from jinja2 import Environment, BaseLoader
-from markupsafe import Markup, escape
+from markupsafe import Markup
 
 import config as config
 
@@ -18,6 +18,12 @@ try:
 except Exception as e:  # pragma: no cover
     get_plotlyjs = None  # type: ignore
 
+try:
+    # Optional fast JSON encoder; the stdlib json module is used when it is missing
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 mother_dir = os.path.dirname(os.path.abspath(__file__))
 html_template_path = os.path.join(mother_dir, "figure_logic", "hotspots_report_template.html")
@@ -25,6 +31,20 @@ html_template_path = os.path.join(mother_dir, "figure_logic", "hotspots_report_t
 with open(html_template_path, "r", encoding="utf-8") as f:
     _HTML_TEMPLATE = f.read()
 
+# Compiled once per process; every report renders from the same template
+_JINJA_ENV = Environment(loader=BaseLoader(), autoescape=True)
+_COMPILED_TEMPLATE = _JINJA_ENV.from_string(_HTML_TEMPLATE)
+
+# plotly.js bundle (~3 MB), fetched on first render
+_PLOTLY_JS: Optional[str] = None
+
+
+def _plotly_js() -> str:
+    global _PLOTLY_JS
+    if _PLOTLY_JS is None:
+        _PLOTLY_JS = get_plotlyjs()
+    return _PLOTLY_JS
+
 
 def _slugify(s: str) -> str:
     s = s.strip().lower()
@@ -68,6 +88,9 @@ class HotspotsReport:
         self.report_title_base = str(report_title_base)
         self.report_type = str(report_type)
         self._figures: List[FigureEntry] = []
+        # Incremental id allocation: occurrences per normalized id, and the id given to each figure
+        self._id_counts: Dict[str, int] = {}
+        self._assigned_ids: List[str] = []
 
     def add_figure(self, entry: FigureEntry | Dict[str, Any]) -> str:
         """Add a figure entry; returns the assigned unique figure id."""
@@ -90,8 +113,12 @@ class HotspotsReport:
 
         self._figures.append(entry)
         # ensure unique ids after adding
-        ids = self._unique_ids()
-        return ids[-1]
+        base = entry.normalized_id()
+        n = self._id_counts.get(base, 0)
+        self._id_counts[base] = n + 1
+        assigned = base if n == 0 else f"{base}-{n+1}"
+        self._assigned_ids.append(assigned)
+        return assigned
 
     def add_figures(self, entries: Iterable[FigureEntry | Dict[str, Any]]) -> List[str]:
         ids: List[str] = []
@@ -135,32 +162,18 @@ class HotspotsReport:
 
         figures = self._build_figures_payload()
 
-        # Build category grouping for the sidebar
+        # Build category grouping for the sidebar; dict order == first appearance of each category
         cat_map: Dict[str, List[Dict[str, str]]] = {}
         for f in figures:
             cat_map.setdefault(f["category"], []).append({"id": f["id"], "title": f["title"]})
 
         categories = [{"name": cat, "items": items} for cat, items in cat_map.items()]
 
-        # Preserve ordering by first appearance of category
-        seen = set()
-        ordered_categories = []
-        for f in figures:
-            cat = f["category"]
-            if cat not in seen:
-                seen.add(cat)
-                ordered_categories.append(cat)
-        categories.sort(key=lambda c: ordered_categories.index(c["name"]) if c["name"] in ordered_categories else 10**9)
-
         # System info: keep insertion order as provided (python 3.7+ dict order)
         system_info_items = list(self.system_info.items())
 
         # Plotly JS once (offline)
-        plotly_js = get_plotlyjs()
-
-        # Jinja2 render
-        env = Environment(loader=BaseLoader(), autoescape=True)
-        tmpl = env.from_string(_HTML_TEMPLATE)
+        plotly_js = _plotly_js()
 
         # figures_index_json is used by JS for menus/dropdowns
         figures_index_json = _to_json([{"id": f["id"], "title": f["title"], "category": f["category"]} for f in figures])
@@ -168,12 +181,13 @@ class HotspotsReport:
         page_title = f"PostgreSQL Hotspots v{self.version}".strip()
 
 
-        rendered = tmpl.render(
+        rendered = _COMPILED_TEMPLATE.render(
             page_title=page_title,
             report_title_base=self.report_title_base,
             report_type=self.report_type,
             version=self.version,
-            system_info_items=[(escape(k), escape(v)) for (k, v) in system_info_items],
+            # Plain strings: the autoescaping environment escapes them during interpolation
+            system_info_items=system_info_items,
             categories=categories,
             figures=[{
                 "id": f["id"],
@@ -188,22 +202,8 @@ class HotspotsReport:
         )
         return rendered
 
-    def _unique_ids(self) -> List[str]:
-        used: Dict[str, int] = {}
-        result: List[str] = []
-        for e in self._figures:
-            base = e.normalized_id()
-            n = used.get(base, 0)
-            if n == 0:
-                used[base] = 1
-                result.append(base)
-            else:
-                used[base] = n + 1
-                result.append(f"{base}-{n+1}")
-        return result
-
     def _build_figures_payload(self) -> List[Dict[str, Any]]:
-        ids = self._unique_ids()
+        ids = self._assigned_ids
         payload: List[Dict[str, Any]] = []
         for idx, e in enumerate(self._figures):
             payload.append(
@@ -219,17 +219,22 @@ class HotspotsReport:
 
 
 def _to_json(obj: Any) -> str:
-    # tiny local helper to avoid requiring extra deps
+    # orjson when available; both paths emit the same compact, non-ASCII-preserving JSON
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
     import json
-    return json.dumps(obj, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
 _NOTE_LINK_RE = re.compile(r'^\s*\[\[(?P<label>[^|\]]+)\|(?P<file>[^\]]+)\]\]\s*$')
+_NOTE_FILENAME_RE = re.compile(r"[A-Za-z0-9._-]+\.(?:txt|log|md)", re.IGNORECASE)
+# Same replacements as markupsafe.escape, applied in one str.translate pass
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&#34;", "'": "&#39;"})
 
-def _note_to_markup(note: str) -> Markup:
+def _note_to_markup(note: str) -> Markup | str:
     """
     Convert note strings into either:
-      - a safe clickable link to a local sibling text file, or
-      - plain escaped text
+      - a safe clickable link to a local sibling text file (Markup), or
+      - plain text (str, escaped by the template's autoescape)
 
     Supported formats:
       1) "analysis.txt"                     -> link with label "analysis.txt"
@@ -237,33 +242,33 @@ def _note_to_markup(note: str) -> Markup:
     """
     s = str(note).strip()
     if not s:
-        return Markup("")
+        return ""
 
     label: str | None = None
     filename: str | None = None
 
-    m = _NOTE_LINK_RE.match(s)
+    m = _NOTE_LINK_RE.match(s) if "[[" in s else None
     if m:
         label = m.group("label").strip()
         filename = m.group("file").strip()
     else:
         # If it looks like a simple safe filename, treat it as a link
-        if re.fullmatch(r"[A-Za-z0-9._-]+\.(txt|log|md)", s, flags=re.IGNORECASE):
+        if _NOTE_FILENAME_RE.fullmatch(s):
             label = s
             filename = s
 
-    # Not a link → render as plain escaped text
+    # Not a link → render as plain text
     if not filename:
-        return Markup(escape(s))
+        return s
 
     # Security: force "same folder" only (no paths)
     safe_name = os.path.basename(filename)
     if safe_name != filename:
         # Path traversal attempt → render as plain text
-        return Markup(escape(s))
+        return s
 
     # URL-encode filename for spaces etc.
     href = quote(safe_name)
 
-    safe_label = escape(label or safe_name)
+    safe_label = (label or safe_name).translate(_ESCAPE_TABLE)
     return Markup(f'<a href="{href}" target="_blank" rel="noopener noreferrer">{safe_label}</a>')
@@ -1,37 +1,178 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Tuple, Optional, Dict, Union, Any
+from typing import List, Tuple, Optional, Dict, Union, Any, Iterable
 
+import numpy as np
 
-@dataclass
+from _ts_kernels import HAVE_NUMBA, group_sorted_minutes
+from utils import dt_to_ns, ns_to_dt
+
+
+_MIN_CAPACITY = 16
+_NS_PER_MINUTE = 60_000_000_000
+_NS_PER_HOUR = 60 * _NS_PER_MINUTE
+
+
+@dataclass(init=False, eq=False, slots=True)
 class TimeSeries:
     """
     Generic time series container.
 
-    values: list of (timestamp, value) tuples
+    Points are stored column-wise in growable NumPy buffers: int64 UTC epoch
+    nanoseconds and the values (the value dtype follows the data, e.g. int64
+    counters are promoted to float64 on the first float). `_sorted` records whether
+    the timestamps are non-decreasing, which lets lookups binary-search. Two series
+    are equal when their units, timestamps and values are equal, in order.
+
+    values: list of (timestamp, value) tuples, materialized on access
     unit: optional unit string (e.g. 'ratio', 'bytes')
+    dtype: optional fixed value dtype; values are cast to it on append instead of
+        following the data (e.g. float32 for bounded ratios, halving the buffer size)
     """
-    values: List[Tuple[datetime, Union[float, int, bool]]] = field(default_factory=list)
-    unit: Optional[str] = None
+    unit: Optional[str]
+    dtype: Optional[np.dtype] = field(repr=False)
+    _ts_buf: np.ndarray = field(repr=False)
+    _val_buf: np.ndarray = field(repr=False)
+    _size: int = field(repr=False)
+    _sorted: bool = field(repr=False)
+
+    def __init__(
+            self,
+            values: Optional[Iterable[Tuple[datetime, Union[float, int, bool]]]] = None,
+            unit: Optional[str] = None,
+            dtype: Optional[np.dtype] = None,
+    ):
+        self.unit = unit
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self._ts_buf = np.empty(0, dtype=np.int64)
+        self._val_buf = np.empty(0, dtype=np.int64 if self.dtype is None else self.dtype)
+        self._size = 0
+        self._sorted = True
+        if values is not None:
+            self.extend(values)
+
+    # --- storage ---------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __eq__(self, other):
+        if not isinstance(other, TimeSeries):
+            return NotImplemented
+        return (
+            self.unit == other.unit
+            and np.array_equal(self.ts_ns, other.ts_ns)
+            and np.array_equal(self.vals, other.vals)
+        )
+
+    @property
+    def ts_ns(self) -> np.ndarray:
+        """Timestamps as int64 UTC epoch nanoseconds (view, do not modify)."""
+        return self._ts_buf[:self._size]
+
+    @property
+    def vals(self) -> np.ndarray:
+        """Values as a NumPy array (view, do not modify)."""
+        return self._val_buf[:self._size]
+
+    @property
+    def values(self) -> List[Tuple[datetime, Union[float, int, bool]]]:
+        return list(zip(self.timestamps(), self.data()))
+
+    @values.setter
+    def values(self, items: Iterable[Tuple[datetime, Union[float, int, bool]]]):
+        self._size = 0
+        self._sorted = True
+        self.extend(items)
+
+    def _ensure_capacity(self, extra: int, dtype: np.dtype) -> None:
+        """Make room for `extra` more points holding values of `dtype` (capacity doubles when full)."""
+        if self.dtype is not None:
+            value_dtype = self.dtype
+        elif self._size == 0:
+            value_dtype = dtype
+        else:
+            value_dtype = np.result_type(self._val_buf.dtype, dtype)
+        needed = self._size + extra
+        if needed <= self._ts_buf.shape[0] and value_dtype == self._val_buf.dtype:
+            return
+        capacity = self._ts_buf.shape[0]
+        if needed > capacity:
+            capacity = max(capacity * 2, needed, _MIN_CAPACITY)
+        ts_buf = np.empty(capacity, dtype=np.int64)
+        val_buf = np.empty(capacity, dtype=value_dtype)
+        ts_buf[:self._size] = self._ts_buf[:self._size]
+        val_buf[:self._size] = self._val_buf[:self._size]
+        self._ts_buf, self._val_buf = ts_buf, val_buf
+
+    def _append_arrays(self, ts_ns: np.ndarray, vals: np.ndarray) -> None:
+        n = ts_ns.shape[0]
+        if n == 0:
+            return
+        if self._sorted:
+            self._sorted = bool(
+                (self._size == 0 or ts_ns[0] >= self._ts_buf[self._size - 1])
+                and np.all(ts_ns[1:] >= ts_ns[:-1])
+            )
+        self._ensure_capacity(n, vals.dtype)
+        self._ts_buf[self._size:self._size + n] = ts_ns
+        self._val_buf[self._size:self._size + n] = vals
+        self._size += n
+
+    def _append_point(self, ns: int, value: Union[float, int, bool]) -> None:
+        if self._sorted and self._size and ns < self._ts_buf[self._size - 1]:
+            self._sorted = False
+        self._ensure_capacity(1, np.asarray(value).dtype)
+        self._ts_buf[self._size] = ns
+        self._val_buf[self._size] = value
+        self._size += 1
+
+    # --- building --------------------------------------------------------
 
     def add(self, ts: datetime, value: Union[float, int, bool]):
-        self.values.append((ts, value))
+        self._append_point(dt_to_ns(ts), value)
+
+    def extend(self, items: Union[TimeSeries, Iterable[Tuple[datetime, Union[float, int, bool]]]]):
+        """
+        Append another TimeSeries, or any iterable of (timestamp, value) pairs, in one call.
+        """
+        if isinstance(items, TimeSeries):
+            self._append_arrays(items.ts_ns, items.vals)
+            return
+        pairs = list(items)
+        if not pairs:
+            return
+        stamps, values = zip(*pairs)
+        self._append_arrays(np.fromiter(map(dt_to_ns, stamps), dtype=np.int64, count=len(stamps)),
+                            np.asarray(values))
+
+    def add_many(self, ts_ns: np.ndarray, values: np.ndarray):
+        """
+        Append points given as parallel arrays of epoch nanoseconds (UTC) and values,
+        with a single buffer resize and slice assignment.
+        """
+        self._append_arrays(np.asarray(ts_ns, dtype=np.int64), np.asarray(values))
+
+    def add_bulk(self, epochs: np.ndarray, values: np.ndarray):
+        """
+        Append points given as parallel arrays of epoch seconds (UTC) and values.
+        """
+        self.add_many(np.asarray(epochs, dtype=np.int64) * 1_000_000_000, values)
+
+    # --- reading ---------------------------------------------------------
 
     def timestamps(self):
-        return [t for t, _ in self.values]
+        return list(map(ns_to_dt, self.ts_ns.tolist()))
 
     def data(self, copy: bool = False):
-        if copy:
-            return [v for _, v in self.values].copy()
-        else:
-            return [v for _, v in self.values]
+        # tolist() always builds a new list, so `copy` needs no extra work
+        return self.vals.tolist()
 
     def copy(self) -> TimeSeries:
-        return TimeSeries(
-            values=[(ts, v) for ts, v in self.values],
-            unit=self.unit,
-        )
+        result = TimeSeries(unit=self.unit, dtype=self.dtype)
+        result._append_arrays(self.ts_ns, self.vals)
+        return result
 
     def sort(self, ascending: bool = True):
         """
@@ -39,17 +180,28 @@ class TimeSeries:
 
         :param ascending: If True, sort oldest → newest. If False, newest → oldest.
         """
-        self.values.sort(key=lambda x: x[0], reverse=not ascending)
+        ts_ns = self.ts_ns
+        # Stable like sorted(..., reverse=True): equal timestamps keep their order either way
+        order = np.argsort(ts_ns if ascending else -ts_ns, kind="stable")
+        self._ts_buf = ts_ns[order]
+        self._val_buf = self.vals[order]
+        self._sorted = ascending or self._size < 2 or bool(self._ts_buf[0] == self._ts_buf[-1])
 
     def get_by_ts(self, ts: datetime) -> Union[float, int, bool]:
         """
         Get value for an exact timestamp.
         Returns 0 if the timestamp does not exist.
         """
-        for t, v in self.values:
-            if t == ts:
-                return v
-        return 0
+        key = dt_to_ns(ts)
+        ts_ns = self.ts_ns
+        if self._sorted:
+            # Binary search; "left" lands on the first of equal timestamps
+            idx = int(np.searchsorted(ts_ns, key))
+            if idx < ts_ns.shape[0] and ts_ns[idx] == key:
+                return self._val_buf[idx].item()
+            return 0
+        hits = np.flatnonzero(ts_ns == key)
+        return self._val_buf[hits[0]].item() if hits.shape[0] else 0
 
     def group_by_minutes(self, min: int, mode: str = "sum") -> None:
         """
@@ -59,30 +211,14 @@ class TimeSeries:
         :param min: Bucket size in minutes
         :param mode: Aggregation mode: "sum" or "avg"
         """
-        if min <= 0:
-            raise ValueError("min must be > 0")
-        if mode not in ("sum", "avg"):
-            raise ValueError("mode must be 'sum' or 'avg'")
-
-        sums: Dict[datetime, float] = {}
-        counts: Dict[datetime, int] = {}
-
-        for ts, value in self.values:
-            bucket_minute = (ts.minute // min) * min
-            bucket_ts = ts.replace(minute=bucket_minute, second=0, microsecond=0)
-
-            sums[bucket_ts] = sums.get(bucket_ts, 0.0) + float(value)
-            counts[bucket_ts] = counts.get(bucket_ts, 0) + 1
-
-        new_values: List[Tuple[datetime, Union[float, int, bool]]] = []
-        for ts in sorted(sums.keys()):
-            if mode == "sum":
-                agg = sums[ts]
-            else:  # avg
-                agg = sums[ts] / counts[ts]
-            new_values.append((ts, agg))
-
-        self.values = new_values
+        ts_ns = self.ts_ns
+        buckets, agg = _bucket_aggregate(ts_ns, self.vals, min, mode)
+        if ts_ns.shape[0] == 0:
+            return
+        if self.dtype is not None:
+            agg = agg.astype(self.dtype)
+        self._ts_buf, self._val_buf, self._size = buckets, agg, buckets.shape[0]
+        self._sorted = True
 
     def combine(
             self,
@@ -92,39 +228,111 @@ class TimeSeries:
         if mode not in ("sum", "avg"):
             raise ValueError("mode must be 'sum' or 'avg'")
 
-        result = TimeSeries(unit=self.unit or other.unit)
-
-        # Build timestamp → value maps
-        self_map: Dict[datetime, Union[float, int, bool]] = {
-            ts: v for ts, v in self.values
-        }
-        other_map: Dict[datetime, Union[float, int, bool]] = {
-            ts: v for ts, v in other.values
-        }
-
-        all_timestamps = set(self_map) | set(other_map)
-
-        for ts in all_timestamps:
-            v1 = self_map.get(ts)
-            v2 = other_map.get(ts)
+        result = TimeSeries(unit=self.unit or other.unit, dtype=self.dtype)
+
+        # Integer-keyed outer join on the timestamp columns; union1d is already sorted
+        ts_a, vals_a = _last_per_timestamp(self.ts_ns, self.vals)
+        ts_b, vals_b = _last_per_timestamp(other.ts_ns, other.vals)
+        all_ts = np.union1d(ts_a, ts_b)
+        idx_a = np.searchsorted(all_ts, ts_a)
+        idx_b = np.searchsorted(all_ts, ts_b)
+
+        has_a = np.zeros(all_ts.shape[0], dtype=bool)
+        has_a[idx_a] = True
+        has_b = np.zeros(all_ts.shape[0], dtype=bool)
+        has_b[idx_b] = True
+        in_b = has_a[idx_b]
+        in_a = has_b[idx_a]
+
+        both = vals_a[in_a] + vals_b[in_b]
+        if mode == "avg":
+            both = both / 2
+        only_a = vals_a[~in_a]
+        only_b = vals_b[~in_b]
+
+        # Same value dtype as appending the points one by one
+        present = [v.dtype for v in (only_a, only_b, both) if v.shape[0]]
+        if not present:
+            return result
+        out = np.empty(all_ts.shape[0], dtype=np.result_type(*present))
+        out[idx_a[~in_a]] = only_a
+        out[idx_b[~in_b]] = only_b
+        out[idx_a[in_a]] = both
+
+        result._append_arrays(all_ts, out)
+        return result
 
-            if v1 is not None and v2 is not None:
-                if mode == "sum":
-                    value = v1 + v2
-                else:  # avg
-                    value = (v1 + v2) / 2
-            else:
-                value = v1 if v1 is not None else v2
 
-            result.add(ts, value)
+def _bucket_aggregate(ts_ns: np.ndarray, vals: np.ndarray, min: int, mode: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Minute-bucket aggregation behind group_by_minutes and fuse_and_bucket.
 
-        result.sort()
-        return result
+    :return: (sorted bucket start nanoseconds, float64 sum or average per bucket)
+    """
+    if min <= 0:
+        raise ValueError("min must be > 0")
+    if mode not in ("sum", "avg"):
+        raise ValueError("mode must be 'sum' or 'avg'")
+
+    step_ns = min * _NS_PER_MINUTE
+    vals = vals.astype(np.float64)
+    if ts_ns.shape[0] == 0:
+        return ts_ns.copy(), vals
+    if HAVE_NUMBA and np.all(ts_ns[1:] >= ts_ns[:-1]):
+        # Compiled single pass over the time-ordered points, no NumPy temporaries
+        return group_sorted_minutes(ts_ns, vals, step_ns, mode == "avg")
+
+    # Buckets restart at every full hour, exactly like ts.replace(minute=...) did
+    hour_ns = ts_ns - ts_ns % _NS_PER_HOUR
+    bucket_ns = hour_ns + (ts_ns - hour_ns) // step_ns * step_ns
+
+    if np.all(bucket_ns[1:] >= bucket_ns[:-1]):
+        # Already in time order: bucket ids come straight from the change points
+        change = bucket_ns[1:] != bucket_ns[:-1]
+        inverse = np.concatenate(([0], np.cumsum(change)))
+        buckets = bucket_ns[np.concatenate(([True], change))]
+    else:
+        buckets, inverse = np.unique(bucket_ns, return_inverse=True)
+
+    # bincount adds in input order, i.e. the same float sums as a running total
+    sums = np.bincount(inverse, weights=vals, minlength=buckets.shape[0])
+    if mode == "sum":
+        return buckets, sums
+    # avg
+    return buckets, sums / np.bincount(inverse, minlength=buckets.shape[0])
+
+
+def fuse_and_bucket(series: Iterable[TimeSeries], min: int, mode: str = "sum") -> TimeSeries:
+    """
+    Pool the points of several series and group them into `min`-minute buckets in one pass.
 
-    def extend(self, timeseries: TimeSeries):
-        self.values.extend(timeseries.values)
+    Same result as concatenating the series and calling group_by_minutes on the copy,
+    without the intermediate copies; the inputs are left untouched. The unit is the
+    first unit set among the inputs.
 
-@dataclass
+    :param series: TimeSeries to pool
+    :param min: Bucket size in minutes
+    :param mode: Aggregation mode: "sum" or "avg"
+    """
+    series = list(series)
+    result = TimeSeries(unit=next((s.unit for s in series if s.unit), None))
+    ts_ns = np.concatenate([s.ts_ns for s in series] or [result.ts_ns])
+    vals = np.concatenate([s.vals for s in series] or [result.vals])
+    buckets, agg = _bucket_aggregate(ts_ns, vals, min, mode)
+    result._append_arrays(buckets, agg)
+    return result
+
+
+def _last_per_timestamp(ts_ns: np.ndarray, vals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted unique timestamps with the last value given for each (like building a dict)."""
+    order = np.argsort(ts_ns, kind="stable")
+    ts_sorted = ts_ns[order]
+    keep = np.empty(ts_sorted.shape[0], dtype=bool)
+    keep[:-1] = ts_sorted[1:] != ts_sorted[:-1]
+    keep[-1:] = True
+    return ts_sorted[keep], vals[order][keep]
+
+@dataclass(slots=True)
 class PerqueryLockTimeMetric:
     querystring: Optional[str] = None
     query_hash: Optional[str] = None
@@ -134,9 +342,8 @@ class PerqueryLockTimeMetric:
     total_wait: int | None = None
 
     perquery_lock_time: TimeSeries = field(default_factory=lambda: TimeSeries(unit="us = microseconds (1,000,000 µs = 1 second)"))
-    pass
 
-@dataclass
+@dataclass(slots=True)
 class PerqueryLatencyMetric:
     querystring: Optional[str] = None
     query_hash: Optional[str] = None
@@ -148,7 +355,7 @@ class PerqueryLatencyMetric:
     perquery_latency_mean: TimeSeries = field(default_factory=lambda: TimeSeries(unit="us = microseconds"))
     perquery_latency_pr75: TimeSeries = field(default_factory=lambda: TimeSeries(unit="us = microseconds"))
 
-@dataclass
+@dataclass(slots=True)
 class PerqueryIOTimeMetric:
     user: Optional[str] = None
     querystring: Optional[str] = None
@@ -157,21 +364,21 @@ class PerqueryIOTimeMetric:
     database: Optional[str] = None
     perquery_IO_time: TimeSeries = field(default_factory=lambda: TimeSeries(unit="us = microseconds"))
 
-@dataclass
+@dataclass(slots=True)
 class WALFlushedBytesCountMetric:
     database_id: Optional[str] = None
     region: Optional[str] = None
 
     wal_flushed_bytes_count: TimeSeries = field(default_factory=lambda: TimeSeries(unit="bytes/min"))
 
-@dataclass
+@dataclass(slots=True)
 class WALInsertedBytesCountMetric:
     database_id: Optional[str] = None
     region: Optional[str] = None
 
     wal_inserted_bytes_count: TimeSeries = field(default_factory=lambda: TimeSeries(unit="bytes/min"))
 
-@dataclass
+@dataclass(slots=True)
 class PSQLNumBackendsByStateMetric:
     state: Optional[str] = None
     database: Optional[str] = None
@@ -179,48 +386,42 @@ class PSQLNumBackendsByStateMetric:
 
     psql_num_backends_by_state: TimeSeries = field(default_factory=lambda: TimeSeries(unit="counts"))
 
-@dataclass
+@dataclass(slots=True)
 class PSQLTransactionCountMetric:
     transaction_type: Optional[str] = None
     database: Optional[str] = None
     psql_transaction_count: TimeSeries = field(default_factory=lambda: TimeSeries(unit="counts"))
 
-@dataclass
+@dataclass(slots=True)
 class PSQLStatementsExecutedCountMetric:
     operation_type: Optional[str] = None
     database: Optional[str] = None
     psql_statements_executed_count: TimeSeries = field(default_factory=lambda: TimeSeries(unit="counts"))
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudSQLMetrics:
     """
     Collected metrics for a single Cloud SQL instance and time window.
     """
     perquery_lock_time_metrics: List[PerqueryLockTimeMetric] = field(default_factory=list)
     perquery_latency_metrics: List[PerqueryLatencyMetric] = field(default_factory=list)
-    perquery_IO_time_metrics: List[PerqueryIOTimeMetric] = field(default=list)
+    perquery_IO_time_metrics: List[PerqueryIOTimeMetric] = field(default_factory=list)
     wal_flushed_bytes_metrics: WALFlushedBytesCountMetric = field(
         default_factory=WALFlushedBytesCountMetric
     )
     wal_inserted_bytes_metrics: WALInsertedBytesCountMetric = field(
         default_factory=WALInsertedBytesCountMetric
     )
-    psql_num_backends_by_state_metrics: List[PSQLNumBackendsByStateMetric] = field(
-        default_factory=PSQLNumBackendsByStateMetric
-    )
-    psql_transaction_count: List[PSQLTransactionCountMetric] = field(
-        default_factory=PSQLTransactionCountMetric
-    )
-    psql_statements_executed_count_metrics: List[PSQLStatementsExecutedCountMetric] = field(
-        default_factory=PSQLStatementsExecutedCountMetric
-    )
+    psql_num_backends_by_state_metrics: List[PSQLNumBackendsByStateMetric] = field(default_factory=list)
+    psql_transaction_count: List[PSQLTransactionCountMetric] = field(default_factory=list)
+    psql_statements_executed_count_metrics: List[PSQLStatementsExecutedCountMetric] = field(default_factory=list)
 
     cpu_usage_time: TimeSeries = field(
         default_factory=lambda: TimeSeries(unit="CPU-seconds")
     )
     cpu_utilization: TimeSeries = field(
-        default_factory=lambda: TimeSeries(unit="ratio")
+        default_factory=lambda: TimeSeries(unit="ratio", dtype=np.float32)
     )
     cpu_reserved_cores: TimeSeries = field(
         default_factory=lambda: TimeSeries(unit="core")
@@ -230,7 +431,7 @@ class CloudSQLMetrics:
         default_factory=lambda: TimeSeries(unit="bytes")
     )
     disk_utilization: TimeSeries = field(
-        default_factory=lambda: TimeSeries(unit="ratio")
+        default_factory=lambda: TimeSeries(unit="ratio", dtype=np.float32)
     )
     disk_read_bytes: TimeSeries = field(
         default_factory=lambda: TimeSeries(unit="bytes")
@@ -258,6 +459,22 @@ class CloudSQLMetrics:
     pg_stat_statements_top_queries: List[Dict] = field(default_factory=list)
     pg_stat_statements_heavy_wal: List[Dict] = field(default_factory=list)
 
+    def __post_init__(self):
+        for name in _CLOUDSQL_LIST_FIELDS:
+            assert isinstance(getattr(self, name), list), f"CloudSQLMetrics.{name} must be a list"
+
+
+_CLOUDSQL_LIST_FIELDS = (
+    "perquery_lock_time_metrics",
+    "perquery_latency_metrics",
+    "perquery_IO_time_metrics",
+    "psql_num_backends_by_state_metrics",
+    "psql_transaction_count",
+    "psql_statements_executed_count_metrics",
+    "pg_stat_statements_top_queries",
+    "pg_stat_statements_heavy_wal",
+)
+
 
 if __name__ == "__main__":
     pass
@@ -13,6 +13,9 @@ from utils import ensure_adc_login, load_db_secret_list, parse_utc_minute
 
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
+_LOG_FORMATTER = logging.Formatter("%(asctime)s.%(msecs)03d | %(levelname)s | %(threadName)s | %(message)s",
+                                   datefmt="%Y-%m-%d | %H:%M:%S")
+
 
 @click.command(context_settings=CONTEXT_SETTINGS)
 def test():
@@ -30,7 +33,9 @@ def test():
 @click.option("--duration-hours", type=int,
               help="Duration in whole hours")
 @click.option("--safe/--no-safe", default=True)
-def generate(project_id, instance_id, output_dir, start_time, end_time, duration_hours, safe):
+@click.option("--probe-headers/--no-probe-headers", default=False,
+              help="Check each metric with a headers-only query first; faster on mostly idle instances")
+def generate(project_id, instance_id, output_dir, start_time, end_time, duration_hours, safe, probe_headers):
     """
     Generate Hotspots report directly. Please make sure you have run at least once command 'connect-db'
 
@@ -58,8 +63,7 @@ def generate(project_id, instance_id, output_dir, start_time, end_time, duration
         )
 
     duration_hours = duration_hours if duration_hours is not None else 0
-    analysis_entry(project_id, instance_id, output_dir, start_time, end_time, duration_hours)
-    pass
+    analysis_entry(project_id, instance_id, output_dir, start_time, end_time, duration_hours, probe_headers)
 
 
 # @click.command(context_settings=CONTEXT_SETTINGS)
@@ -280,21 +284,15 @@ def generate(project_id, instance_id, output_dir, start_time, end_time, duration
                                                   
                     ''')
 def cli():
-    if config.DEBUG:
-        logging.basicConfig(filename='psql-cli.log',
-                            format="%(asctime)s.%(msecs)03d | %(levelname)s | %(threadName)s | %(message)s",
-                            datefmt="%Y-%m-%d | %H:%M:%S",
-                            encoding="utf-8",
-                            level=logging.DEBUG)
-    else:
-        logging.basicConfig(filename='psql-cli.log',
-                            format="%(asctime)s.%(msecs)03d | %(levelname)s | %(threadName)s | %(message)s",
-                            datefmt="%Y-%m-%d | %H:%M:%S",
-                            encoding="utf-8",
-                            level=logging.INFO)
+    root_logger = logging.getLogger()
+    # like basicConfig: only attach the file handler if logging is not configured yet
+    if not root_logger.handlers:
+        handler = logging.FileHandler('psql-cli.log', encoding="utf-8")
+        handler.setFormatter(_LOG_FORMATTER)
+        root_logger.addHandler(handler)
+    root_logger.setLevel(logging.DEBUG if config.DEBUG else logging.INFO)
 
     logging.info(f" ***** PostgreSQL Hotspots {config.VERSION} starts *****")
-    pass
 
 
 cli.add_command(test)
@@ -1,15 +1,34 @@
+import os
 import shutil
 from pathlib import Path
 from typing import Optional
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
 import subprocess
 import click
+import numpy as np
 import logging
 import google.auth
 from google.auth.exceptions import DefaultCredentialsError
 import config
 
+try:
+    # Optional fast JSON parser; the stdlib json module is used when it is missing
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+# Bytes per unit; unknown units fall back to bytes
+_DIV = {"b": 1.0, "bytes": 1.0, "mib": 1024.0 ** 2, "gib": 1024.0 ** 3}
+
+
+@lru_cache(maxsize=None)
+def _unit_factor(unit: str) -> float:
+    """Multiplier converting bytes to `unit` (case-insensitive), computed once per unit string."""
+    return 1.0 / _DIV.get(unit.lower(), 1.0)
+
 
 def bytes_to_unit(value_bytes: float, unit: str = "GiB") -> float:
     """
@@ -18,30 +37,71 @@ def bytes_to_unit(value_bytes: float, unit: str = "GiB") -> float:
     Notes
     -----
     - Returns 0.0 for None to keep Plotly traces and sunbursts stable.
+    - Unknown units return bytes unchanged.
     """
     if value_bytes is None:
         return 0.0
+    return float(value_bytes) * _unit_factor(unit)
+
+
+def bytes_to_unit_arr(values_bytes, unit: str = "GiB") -> np.ndarray:
+    """
+    Vectorized bytes_to_unit: converts a whole array (e.g. TimeSeries.vals) to a float64 array.
+    """
+    return np.asarray(values_bytes, dtype=np.float64) * _unit_factor(unit)
+
+
+# Resolved gcloud executable; the PATH lookup runs once per process
+_GCLOUD_PATH: Optional[str] = None
+
 
-    unit = unit.lower()
+def _gcloud_path() -> Optional[str]:
+    global _GCLOUD_PATH
+    if _GCLOUD_PATH is None:
+        _GCLOUD_PATH = shutil.which("gcloud") or shutil.which("gcloud.cmd")
+    return _GCLOUD_PATH
 
-    if unit in ("b", "bytes"):
-        return float(value_bytes)
-    if unit == "mib":
-        return float(value_bytes) / (1024.0 ** 2)
-    if unit == "gib":
-        return float(value_bytes) / (1024.0 ** 3)
 
-    # Safe fallback: return bytes unchanged
-    return float(value_bytes)
+# (credentials, project, cache key) of the last successful google.auth.default() lookup
+_ADC_CACHE: Optional[tuple] = None
+
+
+def _adc_cache_key() -> tuple:
+    """
+    Identity of the ADC sources google.auth.default() reads: the two environment
+    variables plus the modification times of the credential files they point to.
+    """
+    env_file = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+    config_dir = os.environ.get("CLOUDSDK_CONFIG")
+    if not config_dir:
+        if os.name == "nt":
+            config_dir = os.path.join(os.environ.get("APPDATA", ""), "gcloud")
+        else:
+            config_dir = os.path.join(os.path.expanduser("~"), ".config", "gcloud")
+    mtimes = []
+    for path in (env_file, os.path.join(config_dir, "application_default_credentials.json")):
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns if path else None)
+        except OSError:
+            mtimes.append(None)
+    return env_file, config_dir, tuple(mtimes)
 
 
 def ensure_adc_login():
     """
     Ensures Google Application Default Credentials (ADC) are available.
     Runs `gcloud auth application-default login` only if needed.
+
+    A successful lookup is cached for the process until the ADC environment or files change.
     """
+    global _ADC_CACHE
+    cache_key = _adc_cache_key()
+    if _ADC_CACHE is not None and _ADC_CACHE[2] == cache_key:
+        return True
+
     try:
         credentials, project = google.auth.default()
+        _ADC_CACHE = (credentials, project, cache_key)
         logging.info('Application Default Credentials already configured.')
         if project:
             logging.info(f'Project: {project}')
@@ -50,7 +110,7 @@ def ensure_adc_login():
     except DefaultCredentialsError:
         logging.info('ADC not found. Launching gcloud login...')
 
-        gcloud = shutil.which("gcloud") or shutil.which("gcloud.cmd")
+        gcloud = _gcloud_path()
         if not gcloud:
             logging.error(f'gcloud command not found')
             raise RuntimeError(
@@ -114,10 +174,41 @@ def load_db_secret_list(path: str) -> list[dict]:
         path.write_text("[]", encoding="utf-8")
         return []
 
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+@lru_cache(maxsize=20000)
+def epoch_to_datetime(epoch: int) -> datetime:
+    """
+    UTC datetime for epoch seconds, memoized process-wide.
+
+    Collected points are minute-aligned, so every series of every metric shares the
+    same few thousand timestamps; each one is built once and then reused.
+    """
+    return datetime.fromtimestamp(epoch, tz=timezone.utc)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def dt_to_ns(dt: datetime) -> int:
+    """UTC epoch nanoseconds of a datetime; naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def ns_to_dt(ns: int) -> datetime:
+    """UTC datetime of epoch nanoseconds (microsecond precision)."""
+    seconds, rest = divmod(ns, 1_000_000_000)
+    dt = epoch_to_datetime(seconds)
+    return dt if rest < 1_000 else dt.replace(microsecond=rest // 1_000)
+
+
 def parse_utc_minute(value: Optional[str]) -> Optional[datetime]:
     """Parse 'YYYY-MM-DDTHH:MM' (UTC), no seconds. Returns tz-aware UTC datetime."""
     if value is None: